@@ -6,16 +6,18 @@ import asyncio
 import json
 import logging
 import time
+from collections import deque
 from pathlib import Path
 from typing import Any
 
-from agiraph.config import BASE_DIR, DEFAULT_MODEL
+from agiraph.config import BASE_DIR, DEFAULT_MODEL, MAX_CONVERSATION_LOG
 from agiraph.coordinator import Coordinator
 from agiraph.events import EventBus
 from agiraph.message_bus import MessageBus
 from agiraph.models import (
-    Trigger, WorkBoard, WorkerPool, generate_id,
+    TriggerStore, WorkBoard, WorkerPool, generate_id,
 )
+from agiraph.tools.implementations import flush_worker_memory
 from agiraph.tools.setup import create_default_registry
 
 logger = logging.getLogger(__name__)
@@ -40,6 +42,7 @@ class Agent:
         # Paths
         self.path = BASE_DIR / self.id
         self.path.mkdir(parents=True, exist_ok=True)
+        self.memory_dir = self.path / "memory"
 
         # Create identity files
         self._init_files()
@@ -52,19 +55,24 @@ class Agent:
         (self.current_run_dir / "workers").mkdir(exist_ok=True)
         (self.current_run_dir / "_messages").mkdir(exist_ok=True)
 
+        # Resolved once for the file-browser containment checks
+        self._memory_dir_resolved = self.memory_dir.resolve()
+        self._run_dir_resolved = self.current_run_dir.resolve()
+
         # Core systems
         self.board = WorkBoard()
         self.worker_pool = WorkerPool()
         self.message_bus = MessageBus(log_dir=self.current_run_dir / "_messages")
         self.event_bus = EventBus(log_file=self.path / "events.jsonl")
         self.human_response_queue: asyncio.Queue = asyncio.Queue()
-        self.triggers: list[Trigger] = []
+        self.triggers = TriggerStore()
 
         # Tool registry
         self.registry = create_default_registry()
 
-        # Conversation log (human-facing)
-        self.conversation_log: list[dict] = []
+        # Conversation log (human-facing), bounded to the most recent entries
+        self.conversation_log: deque[dict] = deque(maxlen=MAX_CONVERSATION_LOG)
+        self.conversation_version = 0  # bumped on every append (used for ETags)
 
         # Running worker tasks
         self._running_tasks: dict[str, asyncio.Task] = {}
@@ -97,7 +105,7 @@ class Agent:
         if not memory_file.exists():
             memory_file.write_text("")
 
-        memory_dir = self.path / "memory"
+        memory_dir = self.memory_dir
         memory_dir.mkdir(exist_ok=True)
         (memory_dir / "knowledge").mkdir(exist_ok=True)
         (memory_dir / "experiences").mkdir(exist_ok=True)
@@ -121,6 +129,7 @@ class Agent:
             task.cancel()
             logger.info(f"Cancelled worker task for node {node_id}")
         self._running_tasks.clear()
+        await flush_worker_memory()
 
         # Set all busy workers to idle
         for worker in self.worker_pool.workers.values():
@@ -137,12 +146,7 @@ class Agent:
 
     async def send_message(self, message: str, to: str = "coordinator") -> str:
         """Human sends a message to the agent."""
-        self.conversation_log.append({
-            "role": "human",
-            "to": to,
-            "content": message,
-            "ts": time.time(),
-        })
+        self.log_conversation("human", message, to=to)
         self.message_bus.send("human", to, message)
         self.updated_at = time.time()
 
@@ -155,11 +159,27 @@ class Agent:
     async def respond_to_question(self, response: str):
         """Human responds to an ask_human question."""
         await self.human_response_queue.put(response)
-        self.conversation_log.append({
-            "role": "human",
-            "content": response,
-            "ts": time.time(),
-        })
+        self.log_conversation("human", response)
+
+    def log_conversation(self, role: str, content: str, **extra):
+        """Append an entry to the human-facing conversation log."""
+        entry = {"role": role}
+        entry.update(extra)
+        entry["content"] = content
+        entry["ts"] = time.time()
+        self.conversation_log.append(entry)
+        self.conversation_version += 1
+
+    def board_fingerprint(self) -> int:
+        """Cheap hash of the mutable board state — changes whenever board_view() would."""
+        return hash((
+            tuple(
+                (n.id, n.status, n.assigned_worker, n.result, len(n.children), len(n.dependencies), len(n.refs))
+                for n in self.board.nodes.values()
+            ),
+            tuple((s.name, s.status, len(s.nodes)) for s in self.board.stages),
+            self.board.current_stage,
+        ))
 
     def summary(self) -> dict:
         """Return a summary of the agent's current state."""
@@ -60,12 +60,23 @@ HUMAN_RESPONSE_TIMEOUT = int(os.getenv("AGIRAPH_HUMAN_TIMEOUT", _agent.get("huma
 # Memory
 MAX_MEMORY_INLINE = int(os.getenv("AGIRAPH_MAX_MEMORY_INLINE", _agent.get("max_memory_inline", 20000)))
 
+# In-memory history kept for polling clients. Older conversation entries are dropped
+# (the conversation log is never persisted); older events remain in events.jsonl.
+MAX_CONVERSATION_LOG = int(os.getenv("AGIRAPH_MAX_CONVERSATION_LOG", _agent.get("max_conversation_log", 10000)))
+MAX_EVENT_HISTORY = int(os.getenv("AGIRAPH_MAX_EVENT_HISTORY", _agent.get("max_event_history", 10000)))
+
+# Worker conversations: once a ReAct transcript exceeds twice this many messages,
+# all but the newest ~N are archived to the node's conversation_archive.jsonl
+CONVERSATION_WINDOW = int(os.getenv("AGIRAPH_CONVERSATION_WINDOW", _agent.get("conversation_window", 40)))
+
 # ---------------------------------------------------------------------------
 # Server
 # ---------------------------------------------------------------------------
 
 SERVER_HOST = os.getenv("AGIRAPH_HOST", _server.get("host", "0.0.0.0"))
 SERVER_PORT = int(os.getenv("AGIRAPH_PORT", _server.get("port", 8000)))
+# Event loop for uvicorn: "auto" uses uvloop when installed (uvicorn[standard] ships it off Windows)
+SERVER_LOOP = os.getenv("AGIRAPH_LOOP", _server.get("loop", "auto"))
 
 # ---------------------------------------------------------------------------
 # Search
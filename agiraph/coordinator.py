@@ -5,12 +5,12 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import time
 from datetime import date
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from agiraph.claude_code import ClaudeCodeRunner, parse_claude_code_model
+from agiraph.events import preview_args
 from agiraph.models import ModelResponse, Stage, StageContract, WorkNode, Worker, generate_id
 from agiraph.providers import create_provider
 from agiraph.tools.context import ToolContext
@@ -130,11 +130,7 @@ class Coordinator:
                 if consecutive_errors >= max_consecutive_errors:
                     logger.error(f"Coordinator giving up after {max_consecutive_errors} consecutive LLM errors")
                     self.agent.status = "waiting_for_human"
-                    self.agent.conversation_log.append({
-                        "role": "coordinator",
-                        "content": f"[Error] LLM provider failed {max_consecutive_errors} times in a row. Pausing until you send a message. Last error: {e}",
-                        "ts": time.time(),
-                    })
+                    self.agent.log_conversation("coordinator", f"[Error] LLM provider failed {max_consecutive_errors} times in a row. Pausing until you send a message. Last error: {e}")
                     # Wait for human input before retrying
                     self._human_wakeup.clear()
                     try:
@@ -154,11 +150,7 @@ class Coordinator:
             if response.text:
                 logger.info(f"[Coordinator] {response.text[:200]}")
                 # Send text to human conversation
-                self.agent.conversation_log.append({
-                    "role": "coordinator",
-                    "content": response.text,
-                    "ts": time.time(),
-                })
+                self.agent.log_conversation("coordinator", response.text)
 
             # Handle tool calls
             launched_workers = False
@@ -172,7 +164,7 @@ class Coordinator:
                         "tool.called",
                         self.agent.id,
                         tool=tc.name,
-                        args={k: str(v)[:100] for k, v in tc.args.items()},
+                        args=preview_args(tc.args),
                     )
 
                     result = await self.agent.registry.dispatch(tc, self.context)
@@ -267,11 +259,7 @@ class Coordinator:
                     text = event.text
                     if text:
                         logger.info(f"[Coordinator:ClaudeCode] {text[:200]}")
-                        self.agent.conversation_log.append({
-                            "role": "coordinator",
-                            "content": text,
-                            "ts": time.time(),
-                        })
+                        self.agent.log_conversation("coordinator", text)
 
                     # Forward tool uses as events
                     for tu in event.tool_uses:
@@ -281,7 +269,7 @@ class Coordinator:
                             "tool.called",
                             self.agent.id,
                             tool=f"cc:{tool_name}",
-                            args={k: str(v)[:100] for k, v in tool_input.items()}
+                            args=preview_args(tool_input)
                             if isinstance(tool_input, dict)
                             else {},
                         )
@@ -313,11 +301,7 @@ class Coordinator:
                         is_error=event.is_error,
                     )
                     if result_text:
-                        self.agent.conversation_log.append({
-                            "role": "coordinator",
-                            "content": f"[Result] {result_text}",
-                            "ts": time.time(),
-                        })
+                        self.agent.log_conversation("coordinator", f"[Result] {result_text}")
 
         except Exception as e:
             logger.error(f"[Coordinator:ClaudeCode] Error: {e}", exc_info=True)
@@ -441,12 +425,7 @@ class Coordinator:
                     # Only log non-human messages — human messages are already
                     # logged by agent.send_message() to avoid duplicates
                     if msg.from_id != "human":
-                        self.agent.conversation_log.append({
-                            "role": msg.from_id,
-                            "to": "coordinator",
-                            "content": msg.content,
-                            "ts": time.time(),
-                        })
+                        self.agent.log_conversation(msg.from_id, msg.content, to="coordinator")
 
             # Also check for human messages
             human_msgs = self.agent.message_bus.receive("human_to_coordinator")
@@ -566,10 +545,7 @@ class Coordinator:
         if response.text:
             msg["content"] = response.text
         if response.tool_calls:
-            msg["tool_calls"] = [
-                {"id": tc.id, "name": tc.name, "args": tc.args}
-                for tc in response.tool_calls
-            ]
+            msg["tool_calls"] = [tc.as_dict() for tc in response.tool_calls]
         if not msg.get("content") and not msg.get("tool_calls"):
             msg["content"] = ""
         # Preserve raw content blocks for multi-turn (web search results)
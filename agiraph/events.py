@@ -3,22 +3,63 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import reprlib
+from collections import deque
+from itertools import islice
 from pathlib import Path
 
+from agiraph.config import MAX_EVENT_HISTORY
 from agiraph.models import Event
 
 logger = logging.getLogger(__name__)
 
+SUBSCRIBER_QUEUE_SIZE = 1024
+
+# Bounded repr for tool-arg previews: large lists/dicts are elided instead of stringified whole
+_ARG_REPR = reprlib.Repr()
+_ARG_REPR.maxstring = _ARG_REPR.maxother = 100
+_ARG_REPR.maxlist = _ARG_REPR.maxdict = 5
+
+
+def preview_args(args: dict) -> dict[str, str]:
+    """Short per-argument previews for tool.called events (strings are sliced to 100 chars)."""
+    return {k: v[:100] if isinstance(v, str) else _ARG_REPR.repr(v) for k, v in args.items()}
+
+
+def tail_window(items: deque, limit: int, offset: int = 0) -> list:
+    """Return up to `limit` items ending `offset` items before the tail, oldest first.
+
+    Walks from the right end of the deque, so the cost is O(offset + limit)
+    regardless of how much history is retained.
+    """
+    offset = max(0, offset)
+    window = list(islice(reversed(items), offset, offset + max(0, limit)))
+    window.reverse()
+    return window
+
+
+class _SubscriberQueue(asyncio.Queue):
+    """Subscriber queue whose overflow marker keeps its place while older events are dropped."""
+
+    def drop_oldest(self):
+        """Discard the oldest event; a pending events.overflow marker at the head stays put."""
+        if len(self._queue) > 1 and self._queue[0].type == "events.overflow":
+            del self._queue[1]
+        else:
+            self.get_nowait()
+
 
 class EventBus:
     """Append-only event log with subscription support."""
 
-    def __init__(self, log_file: Path | None = None):
+    def __init__(self, log_file: Path | None = None, max_history: int = MAX_EVENT_HISTORY):
         self._log_file = log_file
         self._subscribers: list[asyncio.Queue] = []
-        self._history: list[Event] = []
+        self._lagging: set[int] = set()  # ids of subscriber queues currently dropping events
+        # Bounded in-memory window; the full history stays in the log file
+        self._history: deque[Event] = deque(maxlen=max_history)
+        self.version = 0  # monotonic count of emitted events (used for ETags)
 
         if log_file:
             log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -26,9 +67,11 @@ class EventBus:
     def emit(self, event: Event):
         """Emit an event — log and notify subscribers."""
         self._history.append(event)
+        self.version += 1
         self._persist(event)
         self._notify(event)
-        logger.debug(f"Event: {event.type} [{event.agent_id}] {event.data}")
+        # %-style args: the payload is only formatted if debug logging is on
+        logger.debug("Event: %s [%s] %s", event.type, event.agent_id, event.data)
 
     def emit_simple(self, type: str, agent_id: str, **data):
         """Convenience: emit with keyword args."""
@@ -36,28 +79,46 @@ class EventBus:
 
     def recent(self, limit: int = 50, offset: int = 0) -> list[Event]:
         """Get recent events (paginated)."""
-        start = max(0, len(self._history) - offset - limit)
-        end = len(self._history) - offset
-        return self._history[start:end]
+        return tail_window(self._history, limit, offset)
+
+    def subscribe(self, maxsize: int = SUBSCRIBER_QUEUE_SIZE) -> asyncio.Queue:
+        """Subscribe to live events.
 
-    def subscribe(self) -> asyncio.Queue:
-        """Subscribe to live events."""
-        q: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        The queue is bounded: a subscriber that falls behind loses its oldest
+        events rather than growing without limit.
+        """
+        q: asyncio.Queue = _SubscriberQueue(maxsize=maxsize)
         self._subscribers.append(q)
         return q
 
     def unsubscribe(self, q: asyncio.Queue):
         if q in self._subscribers:
             self._subscribers.remove(q)
+        self._lagging.discard(id(q))
 
     def _persist(self, event: Event):
         if self._log_file:
-            with open(self._log_file, "a") as f:
-                f.write(json.dumps(event.to_dict()) + "\n")
+            with open(self._log_file, "ab") as f:
+                f.write(event.wire + b"\n")
 
     def _notify(self, event: Event):
         for q in self._subscribers:
+            if q.empty():
+                self._lagging.discard(id(q))  # caught up again
             try:
                 q.put_nowait(event)
             except asyncio.QueueFull:
-                pass
+                self._drop_oldest(q, event)
+
+    def _drop_oldest(self, q: _SubscriberQueue, event: Event):
+        """Make room in a full subscriber queue, flagging the first drop of each lagging spell."""
+        if id(q) not in self._lagging and q.maxsize > 1:
+            self._lagging.add(id(q))
+            # Two oldest events make room for the gap marker and the new event
+            q.get_nowait()
+            q.get_nowait()
+            q.put_nowait(Event(type="events.overflow", agent_id=event.agent_id, data={"queue_size": q.maxsize}))
+        else:
+            # Keeps a pending gap marker at the head, ahead of everything after the gap
+            q.drop_oldest()
+        q.put_nowait(event)
@@ -0,0 +1,73 @@
+"""Blocking filesystem helpers shared by the tools and workers."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Blocking filesystem work runs here so tool calls never stall the event loop
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agiraph-io")
+
+
+async def run_io(fn, *args, **kwargs):
+    """Run a blocking call on the I/O pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_IO_EXECUTOR, functools.partial(fn, *args, **kwargs))
+
+
+# Remembers the most recently created directories so repeat writes skip a mkdir syscall.
+# Bounded, so a long-running server doesn't keep every directory any agent ever used.
+@functools.lru_cache(maxsize=4096)
+def ensure_dir(path: Path):
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def write_text(path: Path, text: str, mode: str = "w"):
+    """Write (or append) text, creating the parent directory on first use."""
+    ensure_dir(path.parent)
+    try:
+        f = open(path, mode)
+    except FileNotFoundError:
+        # The directory was removed behind our back — forget the cached ones and recreate
+        ensure_dir.cache_clear()
+        ensure_dir(path.parent)
+        f = open(path, mode)
+    with f:
+        f.write(text)
+
+
+def read_head(path: Path, limit: int) -> str:
+    """Read at most `limit` chars (plus one to detect truncation) instead of the whole file."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        content = f.read(limit + 1)
+    if len(content) > limit:
+        content = content[:limit] + "\n\n[... truncated ...]"
+    return content
+
+
+def copy_entry(src: Path, dest: Path):
+    """Copy a file, or a directory tree merged into `dest`."""
+    if src.is_dir():
+        shutil.copytree(src, dest, dirs_exist_ok=True, copy_function=_fast_copy)
+    else:
+        _fast_copy(src, dest)
+
+
+def _fast_copy(src: Path | str, dst: Path | str):
+    """copy2 that lets the kernel do the copy (reflinking on btrfs/xfs) via copy_file_range."""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except (AttributeError, OSError):
+        # No copy_file_range (non-Linux) or unsupported across these filesystems
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import threading
 from collections import defaultdict
 from pathlib import Path
 
 from agiraph.models import Message
+from agiraph.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,7 @@ class MessageBus:
         self._lock = threading.Lock()
         self._log_dir = log_dir
         self._subscribers: list[asyncio.Queue] = []
+        self._wakeups: dict[str, asyncio.Event] = {}  # set when a waiting entity gets mail
 
         if log_dir:
             log_dir.mkdir(parents=True, exist_ok=True)
@@ -33,7 +34,10 @@ class MessageBus:
             self._queues[to_id].append(msg)
         self._log(msg)
         self._notify(msg)
-        logger.debug(f"Message: {from_id} → {to_id}: {content[:80]}")
+        wakeup = self._wakeups.get(to_id)
+        if wakeup is not None:
+            wakeup.set()
+        logger.debug("Message: %s → %s: %.80s", from_id, to_id, content)
         return msg
 
     def broadcast(self, from_id: str, content: str, exclude: set[str] | None = None):
@@ -46,6 +50,8 @@ class MessageBus:
 
     def receive(self, entity_id: str) -> list[Message]:
         """Drain and return all messages for an entity."""
+        if not self._queues.get(entity_id):
+            return []  # fast path for the common empty case; dict reads are atomic under the GIL
         with self._lock:
             messages = self._queues.pop(entity_id, [])
         return messages
@@ -59,6 +65,22 @@ class MessageBus:
         with self._lock:
             return bool(self._queues.get(entity_id))
 
+    async def wait(self, entity_id: str, timeout: float | None = None) -> bool:
+        """Wait until the entity has pending messages or `timeout` elapses.
+
+        Returns whether messages are pending; they are not drained.
+        """
+        if self.has_messages(entity_id):
+            return True
+        wakeup = self._wakeups.setdefault(entity_id, asyncio.Event())
+        wakeup.clear()
+        try:
+            async with asyncio.timeout(timeout):
+                await wakeup.wait()
+        except TimeoutError:
+            pass
+        return self.has_messages(entity_id)
+
     def register(self, entity_id: str):
         """Register an entity so broadcasts reach it."""
         with self._lock:
@@ -78,8 +100,8 @@ class MessageBus:
     def _log(self, msg: Message):
         if self._log_dir:
             log_file = self._log_dir / "messages.jsonl"
-            with open(log_file, "a") as f:
-                f.write(json.dumps(msg.to_dict()) + "\n")
+            with open(log_file, "ab") as f:
+                f.write(dumps(msg.to_dict()) + b"\n")
 
     def _notify(self, msg: Message):
         for q in self._subscribers:
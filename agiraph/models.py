@@ -5,9 +5,12 @@ from __future__ import annotations
 import time
 import uuid
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+from agiraph.serialization import dumps
+
 
 def generate_id() -> str:
     return uuid.uuid4().hex[:12]
@@ -27,14 +30,19 @@ class ToolDef:
     parameters: dict[str, Any]  # JSON Schema
     guidance: str = ""  # long, for the prompt (tips, patterns)
     coordinator_only: bool = False
+    idempotent: bool = False  # read-only: a repeat call with the same args may be served from cache
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolCall:
     name: str
     args: dict[str, Any]
     id: str = field(default_factory=lambda: f"tc_{uuid.uuid4().hex[:8]}")
 
+    def as_dict(self) -> dict[str, Any]:
+        """Conversation-log form of the call."""
+        return {"id": self.id, "name": self.name, "args": self.args}
+
 
 @dataclass
 class TokenUsage:
@@ -202,6 +210,14 @@ class Event:
     def to_dict(self) -> dict:
         return {"type": self.type, "agent_id": self.agent_id, "ts": self.ts, "data": self.data}
 
+    @cached_property
+    def wire(self) -> bytes:
+        """JSON encoding, built once and shared by the event log, WebSocket, and polling.
+
+        Events are treated as immutable once emitted.
+        """
+        return dumps(self.to_dict())
+
 
 # ---------------------------------------------------------------------------
 # Triggers
@@ -234,3 +250,36 @@ class Trigger:
             "created_at": self.created_at,
             "metadata": self.metadata,
         }
+
+
+@dataclass
+class TriggerStore:
+    """Triggers by id, with an insertion-ordered index of the active ones."""
+
+    triggers: dict[str, Trigger] = field(default_factory=dict)
+    _active: dict[str, None] = field(default_factory=dict, repr=False)
+
+    def add(self, trigger: Trigger):
+        self.triggers[trigger.id] = trigger
+        if trigger.status == "active":
+            self._active[trigger.id] = None
+
+    def get(self, trigger_id: str) -> Trigger | None:
+        return self.triggers.get(trigger_id)
+
+    def active(self) -> list[Trigger]:
+        # Re-check status in case a trigger was fired/expired without going through cancel()
+        return [t for tid in self._active if (t := self.triggers[tid]).status == "active"]
+
+    def cancel(self, trigger_id: str) -> Trigger | None:
+        trigger = self.triggers.get(trigger_id)
+        if trigger:
+            trigger.status = "expired"
+            self._active.pop(trigger_id, None)
+        return trigger
+
+    def __len__(self) -> int:
+        return len(self.triggers)
+
+    def __iter__(self):
+        return iter(self.triggers.values())
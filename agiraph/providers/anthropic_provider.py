@@ -15,6 +15,19 @@ from agiraph.providers.base import ProviderAdapter
 logger = logging.getLogger(__name__)
 
 
+def _with_cache_breakpoint(message: dict) -> dict:
+    """Copy of a user message whose last content block carries an ephemeral cache_control."""
+    content = message["content"]
+    if isinstance(content, str):
+        if not content:
+            return message  # empty text blocks can't carry a breakpoint
+        blocks = [{"type": "text", "text": content}]
+    else:
+        blocks = list(content)
+    blocks[-1] = {**blocks[-1], "cache_control": {"type": "ephemeral"}}
+    return {**message, "content": blocks}
+
+
 class AnthropicAdapter(ProviderAdapter):
     def __init__(self, model: str = "claude-sonnet-4-5-20250929"):
         self.model = model
@@ -30,6 +43,19 @@ class AnthropicAdapter(ProviderAdapter):
             for t in tools
         ]
 
+    def _build_tools_payload(self, tools: list[ToolDef]) -> list[dict]:
+        formatted_tools = self.format_tools(tools)
+        # Add native web search — all Anthropic models support it.
+        # The breakpoint on the last tool caches the whole tool block, which
+        # is byte-identical across iterations and across workers of a run.
+        formatted_tools.append({
+            "type": "web_search_20250305",
+            "name": "web_search",
+            "max_uses": NATIVE_SEARCH_MAX_USES,
+            "cache_control": {"type": "ephemeral"},
+        })
+        return formatted_tools
+
     def format_tool_prompt(self, tools: list[ToolDef]) -> str:
         lines = ["## Tool Usage Guide\n"]
         for t in tools:
@@ -53,17 +79,11 @@ class AnthropicAdapter(ProviderAdapter):
         }
 
         if system:
-            kwargs["system"] = system
+            # Cache breakpoint: tools + system prompt form a stable prefix across iterations
+            kwargs["system"] = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
 
         if tools:
-            formatted_tools = self.format_tools(tools)
-            # Add native web search — all Anthropic models support it
-            formatted_tools.append({
-                "type": "web_search_20250305",
-                "name": "web_search",
-                "max_uses": NATIVE_SEARCH_MAX_USES,
-            })
-            kwargs["tools"] = formatted_tools
+            kwargs["tools"] = self.prepare_tools(tools)
 
         try:
             raw = await self.client.messages.create(**kwargs)
@@ -80,46 +100,49 @@ class AnthropicAdapter(ProviderAdapter):
 
     def _format_messages(self, messages: list[dict]) -> list[dict]:
         """Convert our internal format to Anthropic's format."""
-        formatted = []
-        for msg in messages:
-            role = msg.get("role", "user")
-            if role == "system":
-                continue  # system messages go via the system parameter
-            if role == "tool":
-                formatted.append({
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": msg.get("tool_use_id", msg.get("id", "unknown")),
-                            "content": str(msg.get("content", "")),
-                        }
-                    ],
-                })
-            elif role == "assistant":
-                # If we stored raw content blocks (e.g., from web search turn),
-                # pass them through directly to preserve encrypted search results.
-                raw_blocks = msg.get("_content_blocks")
-                if raw_blocks:
-                    formatted.append({"role": "assistant", "content": raw_blocks})
-                else:
-                    content = msg.get("content", "")
-                    tool_calls = msg.get("tool_calls", [])
-                    blocks: list[dict] = []
-                    if content:
-                        blocks.append({"type": "text", "text": content})
-                    for tc in tool_calls:
-                        blocks.append({
-                            "type": "tool_use",
-                            "id": tc.get("id", "unknown"),
-                            "name": tc.get("name", ""),
-                            "input": tc.get("args", tc.get("input", {})),
-                        })
-                    formatted.append({"role": "assistant", "content": blocks if blocks else content or ""})
-            else:
-                formatted.append({"role": "user", "content": str(msg.get("content", ""))})
+        formatted = self._format_history(messages)
+        if formatted and formatted[-1]["role"] == "user":
+            # Cache breakpoint on the newest turn: the next call re-reads the
+            # whole conversation so far from the prompt cache.
+            formatted[-1] = _with_cache_breakpoint(formatted[-1])
         return formatted
 
+    def _format_message(self, msg: dict) -> dict | None:
+        role = msg.get("role", "user")
+        if role == "system":
+            return None  # system messages go via the system parameter
+        if role == "tool":
+            return {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": msg.get("tool_use_id", msg.get("id", "unknown")),
+                        "content": str(msg.get("content", "")),
+                    }
+                ],
+            }
+        if role == "assistant":
+            # If we stored raw content blocks (e.g., from web search turn),
+            # pass them through directly to preserve encrypted search results.
+            raw_blocks = msg.get("_content_blocks")
+            if raw_blocks:
+                return {"role": "assistant", "content": raw_blocks}
+            content = msg.get("content", "")
+            tool_calls = msg.get("tool_calls", [])
+            blocks: list[dict] = []
+            if content:
+                blocks.append({"type": "text", "text": content})
+            for tc in tool_calls:
+                blocks.append({
+                    "type": "tool_use",
+                    "id": tc.get("id", "unknown"),
+                    "name": tc.get("name", ""),
+                    "input": tc.get("args", tc.get("input", {})),
+                })
+            return {"role": "assistant", "content": blocks if blocks else content or ""}
+        return {"role": "user", "content": str(msg.get("content", ""))}
+
     def _parse_response(self, raw: Any) -> ModelResponse:
         tool_calls = []
         text_parts = []
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 from agiraph.models import ModelResponse, ToolDef
@@ -41,12 +42,66 @@ class ProviderAdapter(ABC):
     def count_tokens(self, messages: list[dict]) -> int:
         """Estimate token count for messages."""
 
+    def prepare_tools(self, tools: Sequence[ToolDef]) -> Any:
+        """API tool payload for `tools`, memoized on the identity of the sequence.
+
+        The registry hands out the same cached tuple on every call, so the
+        schema is formatted once per run instead of once per LLM call.
+        Callers must not mutate the returned payload.
+        """
+        memo = self.__dict__.get("_tools_memo")
+        if memo is None or memo[0] is not tools:
+            memo = self._tools_memo = (tools, self._build_tools_payload(tools))
+        return memo[1]
+
+    def _build_tools_payload(self, tools: Sequence[ToolDef]) -> Any:
+        """Hook for adapters that send more than format_tools() (e.g. native tools)."""
+        return self.format_tools(tools)
+
+    @abstractmethod
+    def _format_message(self, msg: dict) -> dict | None:
+        """Convert one internal message to the provider's format (None to drop it)."""
+
+    def _format_history(self, messages: list[dict]) -> list[dict]:
+        """Format a conversation, reusing the formatted prefix from the previous call.
+
+        Conversations only grow between calls, so each message is formatted
+        once rather than on every iteration. If the list was replaced or
+        rewritten (checked by identity at both ends of the cached prefix),
+        it is formatted from scratch. Returns a fresh list; the formatted
+        message dicts are shared with the cache and must not be mutated.
+        """
+        memo = self.__dict__.get("_history_memo")
+        if memo is not None:
+            sources, formatted = memo
+            n = len(sources)
+            if not (n <= len(messages) and (n == 0 or (messages[0] is sources[0] and messages[n - 1] is sources[n - 1]))):
+                memo = None
+        if memo is None:
+            sources, formatted = [], []
+            self._history_memo = (sources, formatted)
+
+        for msg in messages[len(sources):]:
+            sources.append(msg)
+            entry = self._format_message(msg)
+            if entry is not None:
+                formatted.append(entry)
+        return list(formatted)
+
+    def prepare_tool_prompt(self, tools: Sequence[ToolDef]) -> str:
+        """format_tool_prompt, memoized on the identity of `tools`."""
+        memo = self.__dict__.get("_tool_prompt_memo")
+        if memo is None or memo[0] is not tools:
+            memo = self._tool_prompt_memo = (tools, self.format_tool_prompt(tools))
+        return memo[1]
+
 
 class ModelProvider:
     """Unified interface — wraps a ProviderAdapter and handles tool prompt injection."""
 
     def __init__(self, adapter: ProviderAdapter):
         self.adapter = adapter
+        self._system_memo: tuple[str, Sequence[ToolDef], str] | None = None
 
     async def generate(
         self,
@@ -58,8 +113,7 @@ class ModelProvider:
     ) -> ModelResponse:
         # Inject tool guidance into system prompt
         if tools and system:
-            tool_prompt = self.adapter.format_tool_prompt(tools)
-            system = system + "\n\n" + tool_prompt
+            system = self._system_with_tools(system, tools)
 
         return await self.adapter.generate(
             messages=messages,
@@ -69,5 +123,16 @@ class ModelProvider:
             max_tokens=max_tokens,
         )
 
+    def _system_with_tools(self, system: str, tools: Sequence[ToolDef]) -> str:
+        """System prompt plus tool guidance, built once per (system, tools) pair.
+
+        Workers pass the same objects on every iteration, so the static prefix
+        is assembled once and reused as-is.
+        """
+        memo = self._system_memo
+        if memo is None or memo[0] is not system or memo[1] is not tools:
+            memo = self._system_memo = (system, tools, system + "\n\n" + self.adapter.prepare_tool_prompt(tools))
+        return memo[2]
+
     def count_tokens(self, messages: list[dict]) -> int:
         return self.adapter.count_tokens(messages)
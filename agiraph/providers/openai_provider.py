@@ -58,7 +58,7 @@ class OpenAIAdapter(ProviderAdapter):
         }
 
         if tools:
-            kwargs["tools"] = self.format_tools(tools)
+            kwargs["tools"] = self.prepare_tools(tools)
 
         try:
             raw = await self.client.chat.completions.create(**kwargs)
@@ -73,43 +73,42 @@ class OpenAIAdapter(ProviderAdapter):
         return total // 4
 
     def _format_messages(self, messages: list[dict], system: str | None = None) -> list[dict]:
-        formatted = []
+        formatted = self._format_history(messages)
         if system:
-            formatted.append({"role": "system", "content": system})
-
-        for msg in messages:
-            role = msg.get("role", "user")
-            if role == "system":
-                formatted.append({"role": "system", "content": msg.get("content", "")})
-            elif role == "tool":
-                formatted.append({
-                    "role": "tool",
-                    "tool_call_id": msg.get("tool_use_id", msg.get("id", "unknown")),
-                    "content": str(msg.get("content", "")),
-                })
-            elif role == "assistant":
-                entry: dict[str, Any] = {"role": "assistant"}
-                content = msg.get("content", "")
-                if content:
-                    entry["content"] = content
-                tool_calls = msg.get("tool_calls", [])
-                if tool_calls:
-                    entry["tool_calls"] = [
-                        {
-                            "id": tc.get("id", "unknown"),
-                            "type": "function",
-                            "function": {
-                                "name": tc.get("name", ""),
-                                "arguments": json.dumps(tc.get("args", {})),
-                            },
-                        }
-                        for tc in tool_calls
-                    ]
-                formatted.append(entry)
-            else:
-                formatted.append({"role": "user", "content": str(msg.get("content", ""))})
+            formatted.insert(0, {"role": "system", "content": system})
         return formatted
 
+    def _format_message(self, msg: dict) -> dict | None:
+        role = msg.get("role", "user")
+        if role == "system":
+            return {"role": "system", "content": msg.get("content", "")}
+        if role == "tool":
+            return {
+                "role": "tool",
+                "tool_call_id": msg.get("tool_use_id", msg.get("id", "unknown")),
+                "content": str(msg.get("content", "")),
+            }
+        if role == "assistant":
+            entry: dict[str, Any] = {"role": "assistant"}
+            content = msg.get("content", "")
+            if content:
+                entry["content"] = content
+            tool_calls = msg.get("tool_calls", [])
+            if tool_calls:
+                entry["tool_calls"] = [
+                    {
+                        "id": tc.get("id", "unknown"),
+                        "type": "function",
+                        "function": {
+                            "name": tc.get("name", ""),
+                            "arguments": json.dumps(tc.get("args", {})),
+                        },
+                    }
+                    for tc in tool_calls
+                ]
+            return entry
+        return {"role": "user", "content": str(msg.get("content", ""))}
+
     def _parse_response(self, raw: Any) -> ModelResponse:
         msg = raw.choices[0].message
         tool_calls = []
@@ -76,6 +76,10 @@ class TextFallbackAdapter(ProviderAdapter):
     def count_tokens(self, messages: list[dict]) -> int:
         return self.inner.count_tokens(messages)
 
+    def _format_message(self, msg: dict) -> dict | None:
+        # Messages are sent through the inner adapter, in its format
+        return self.inner._format_message(msg)
+
     def _parse_tool_calls(self, text: str) -> list[ToolCall]:
         tool_calls = []
         for match in re.finditer(r"<tool_call>(.*?)</tool_call>", text, re.DOTALL):
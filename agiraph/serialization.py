@@ -0,0 +1,38 @@
+"""JSON encoding helpers — one orjson configuration shared by logs, tools, and the API."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Encode the few non-JSON types that show up in agent state."""
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (sort_keys gives a canonical form for cache keys)."""
+    option = _OPTIONS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=_default, option=option)
+
+
+def dumps_str(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string (for tool results and text frames)."""
+    return dumps(obj, indent=indent).decode()
+
+
+loads = orjson.loads
+JSONDecodeError = orjson.JSONDecodeError
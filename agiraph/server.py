@@ -5,22 +5,39 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from agiraph.agent import Agent
-from agiraph.config import BASE_DIR, SERVER_HOST, SERVER_PORT
+from agiraph.config import BASE_DIR, SERVER_HOST, SERVER_LOOP, SERVER_PORT
+from agiraph.events import tail_window
+from agiraph.serialization import dumps
+from agiraph.tools.implementations import close_http_client, flush_worker_memory
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Agiraph", version="2.0", description="Autonomous AI Agent Framework")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Release shared resources on shutdown."""
+    yield
+    await flush_worker_memory()
+    await close_http_client()
+
+
+app = FastAPI(title="Agiraph", version="2.0", description="Autonomous AI Agent Framework", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -29,10 +46,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Board/conversation/event JSON is highly repetitive; WebSocket frames are not touched
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Agent registry — all active agents
 agent_registry: dict[str, Agent] = {}
 
+# Background agent.start() tasks, held so they are not garbage-collected mid-run
+_agent_tasks: dict[str, asyncio.Task] = {}
+
 
 # ---------------------------------------------------------------------------
 # Request / Response Models
@@ -67,7 +89,9 @@ async def create_agent(req: CreateAgentRequest) -> dict:
     agent_registry[agent.id] = agent
 
     # Start the agent in the background
-    asyncio.create_task(agent.start())
+    task = asyncio.create_task(agent.start(), name=f"agent-{agent.id}")
+    _agent_tasks[agent.id] = task
+    task.add_done_callback(lambda t, agent_id=agent.id: _forget_task(agent_id, t))
 
     logger.info(f"Agent {agent.id} created and started: {req.goal[:80]}")
     return agent.summary()
@@ -92,6 +116,12 @@ async def delete_agent(agent_id: str) -> dict:
     agent = _get_agent(agent_id)
     await agent.stop()
     agent_registry.pop(agent_id, None)
+
+    # stop() keeps the coordinator alive for resume; deletion ends it for good
+    task = _agent_tasks.pop(agent_id, None)
+    if task:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
     return {"status": "deleted", "id": agent_id}
 
 
@@ -125,12 +155,16 @@ async def respond_to_question(agent_id: str, req: RespondRequest) -> dict:
 
 
 @app.get("/agents/{agent_id}/conversation")
-async def get_conversation(agent_id: str, limit: int = 50, offset: int = 0) -> list[dict]:
+async def get_conversation(
+    agent_id: str, request: Request, response: Response, limit: int = 50, offset: int = 0,
+) -> list[dict]:
     """Get conversation thread."""
     agent = _get_agent(agent_id)
-    start = max(0, len(agent.conversation_log) - offset - limit)
-    end = len(agent.conversation_log) - offset
-    return agent.conversation_log[start:end]
+    etag = _etag(agent.id, "conversation", agent.conversation_version, limit, offset)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return tail_window(agent.conversation_log, limit, offset)
 
 
 # ---------------------------------------------------------------------------
@@ -139,9 +173,13 @@ async def get_conversation(agent_id: str, limit: int = 50, offset: int = 0) -> l
 
 
 @app.get("/agents/{agent_id}/board")
-async def get_board(agent_id: str) -> dict:
+async def get_board(agent_id: str, request: Request, response: Response) -> dict:
     """Get all work nodes and their status."""
     agent = _get_agent(agent_id)
+    etag = _etag(agent.id, "board", agent.board_fingerprint())
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return agent.board_view()
 
 
@@ -183,30 +221,35 @@ async def get_workers(agent_id: str) -> list[dict]:
 
 
 @app.get("/agents/{agent_id}/workspace")
-async def list_workspace(agent_id: str, path: str = "") -> dict:
+async def list_workspace(agent_id: str, request: Request, response: Response, path: str = "") -> dict:
     """List workspace files/directories."""
     agent = _get_agent(agent_id)
-    base = agent.current_run_dir
-    target = (base / path).resolve()
+    target = (agent.current_run_dir / path).resolve()
 
-    if not str(target).startswith(str(base.resolve())):
+    if not target.is_relative_to(agent._run_dir_resolved):
         raise HTTPException(status_code=403, detail="Path escapes workspace")
 
     if not target.exists():
         raise HTTPException(status_code=404, detail="Path not found")
 
     if target.is_file():
+        # File ETags come from stat, so unchanged files are never re-read
+        st = target.stat()
+        etag = _etag(agent.id, "workspace", st.st_mtime_ns, st.st_size)
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
         content = target.read_text(errors="replace")
         return {"type": "file", "path": path, "content": content[:100000]}
 
-    entries = []
-    for item in sorted(target.iterdir()):
-        entries.append({
-            "name": item.name,
-            "type": "dir" if item.is_dir() else "file",
-            "size": item.stat().st_size if item.is_file() else None,
-        })
-    return {"type": "dir", "path": path, "entries": entries}
+    rows = await asyncio.to_thread(_scan_dir, target, True)
+    # Directory mtime does not track file sizes, so hash the listing itself
+    etag = _etag(agent.id, "workspace", hash(tuple(rows)))
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return StreamingResponse(
+        _stream_listing(path, rows, with_sizes=True), media_type="application/json", headers={"ETag": etag},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -215,28 +258,31 @@ async def list_workspace(agent_id: str, path: str = "") -> dict:
 
 
 @app.get("/agents/{agent_id}/memory")
-async def list_memory(agent_id: str, path: str = "") -> dict:
+async def list_memory(agent_id: str, request: Request, response: Response, path: str = "") -> dict:
     """List memory files."""
     agent = _get_agent(agent_id)
-    base = agent.path / "memory"
-    target = (base / path).resolve()
+    target = (agent.memory_dir / path).resolve()
 
-    if not str(target).startswith(str(base.resolve())):
+    if not target.is_relative_to(agent._memory_dir_resolved):
         raise HTTPException(status_code=403, detail="Path escapes memory dir")
 
     if not target.exists():
         return {"type": "dir", "path": path, "entries": []}
 
+    # Memory listings carry no sizes, so the target's own stat is a sufficient validator
+    st = target.stat()
+    etag = _etag(agent.id, "memory", st.st_mtime_ns, st.st_size)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     if target.is_file():
         return {"type": "file", "path": path, "content": target.read_text(errors="replace")}
 
-    entries = []
-    for item in sorted(target.iterdir()):
-        entries.append({
-            "name": item.name,
-            "type": "dir" if item.is_dir() else "file",
-        })
-    return {"type": "dir", "path": path, "entries": entries}
+    rows = await asyncio.to_thread(_scan_dir, target, False)
+    return StreamingResponse(
+        _stream_listing(path, rows, with_sizes=False), media_type="application/json", headers={"ETag": etag},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -257,7 +303,7 @@ async def event_stream(websocket: WebSocket, agent_id: str):
     try:
         while True:
             event = await queue.get()
-            await websocket.send_json(event.to_dict())
+            await websocket.send_text(event.wire.decode())
     except WebSocketDisconnect:
         pass
     finally:
@@ -265,11 +311,16 @@ async def event_stream(websocket: WebSocket, agent_id: str):
 
 
 @app.get("/agents/{agent_id}/events")
-async def get_events(agent_id: str, limit: int = 50, offset: int = 0) -> list[dict]:
+async def get_events(agent_id: str, request: Request, limit: int = 50, offset: int = 0) -> list[dict]:
     """Get recent events (polling fallback)."""
     agent = _get_agent(agent_id)
+    etag = _etag(agent.id, "events", agent.event_bus.version, limit, offset)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     events = agent.event_bus.recent(limit=limit, offset=offset)
-    return [e.to_dict() for e in events]
+    # Reuse each event's cached encoding instead of re-serializing the list
+    body = b"[" + b",".join(e.wire for e in events) + b"]"
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 # ---------------------------------------------------------------------------
@@ -288,6 +339,53 @@ def _get_agent_safe(agent_id: str) -> Agent | None:
     return agent_registry.get(agent_id)
 
 
+_LISTING_CHUNK = 500  # entries encoded per streamed chunk
+
+
+def _scan_dir(target: Path, with_sizes: bool) -> list[tuple[str, bool, int | None]]:
+    """One scandir pass → sorted (name, is_dir, size) rows. Runs off the event loop."""
+    with os.scandir(target) as it:
+        rows = [
+            (e.name, e.is_dir(), e.stat().st_size if with_sizes and e.is_file() else None)
+            for e in it
+        ]
+    rows.sort()
+    return rows
+
+
+def _stream_listing(path: str, rows: list[tuple[str, bool, int | None]], with_sizes: bool) -> Iterator[bytes]:
+    """Encode a directory listing in chunks instead of materializing the whole JSON body."""
+    yield b'{"type":"dir","path":' + dumps(path) + b',"entries":['
+    for i in range(0, len(rows), _LISTING_CHUNK):
+        chunk = [
+            {"name": name, "type": "dir" if is_dir else "file", "size": size}
+            if with_sizes else
+            {"name": name, "type": "dir" if is_dir else "file"}
+            for name, is_dir, size in rows[i:i + _LISTING_CHUNK]
+        ]
+        yield (b"," if i else b"") + dumps(chunk)[1:-1]
+    yield b"]}"
+
+
+def _forget_task(agent_id: str, task: asyncio.Task):
+    if _agent_tasks.get(agent_id) is task:
+        del _agent_tasks[agent_id]
+
+
+def _etag(*parts: Any) -> str:
+    """Build a strong ETag from an agent id plus version/fingerprint parts."""
+    return '"' + "-".join(str(p) for p in parts) + '"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """True if the client's If-None-Match already covers `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = (c.strip().removeprefix("W/") for c in header.split(","))
+    return any(c == etag or c == "*" for c in candidates)
+
+
 # ---------------------------------------------------------------------------
 # Entry Point
 # ---------------------------------------------------------------------------
@@ -296,7 +394,7 @@ def _get_agent_safe(agent_id: str) -> Agent | None:
 def main():
     """Start the Agiraph server."""
     print(f"Starting Agiraph v2 server on {SERVER_HOST}:{SERVER_PORT}")
-    uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT, log_level="info")
+    uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT, loop=SERVER_LOOP, log_level="info")
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from agiraph.models import Trigger, WorkBoard, WorkNode, Worker, WorkerPool
+from agiraph.models import Event, TriggerStore, WorkBoard, WorkNode, Worker, WorkerPool
 
 if TYPE_CHECKING:
     from agiraph.events import EventBus
@@ -33,11 +33,13 @@ class ToolContext:
         event_bus: "EventBus | None" = None,
         human_response_queue: asyncio.Queue | None = None,
         human_timeout: int = 3600,
-        trigger_store: list[Trigger] | None = None,
+        trigger_store: TriggerStore | None = None,
         default_model: str = "anthropic/claude-sonnet-4-5",
     ):
         self.agent_id = agent_id
         self.agent_path = agent_path or Path(".")
+        self._agent_home_resolved = self.agent_path.resolve()
+        self.memory_dir = self.agent_path / "memory"
         self.run_dir = run_dir
         self.node = node
         self.worker = worker
@@ -47,7 +49,7 @@ class ToolContext:
         self.event_bus = event_bus
         self.human_response_queue = human_response_queue or asyncio.Queue()
         self.human_timeout = human_timeout
-        self.trigger_store = trigger_store if trigger_store is not None else []
+        self.trigger_store = trigger_store if trigger_store is not None else TriggerStore()
         self.default_model = default_model
 
     def resolve_path(self, path: str) -> Path:
@@ -55,7 +57,7 @@ class ToolContext:
         if self.run_dir:
             resolved = (self.run_dir / path).resolve()
             # Security: prevent path traversal outside the agent's home
-            if self.agent_path and not str(resolved).startswith(str(self.agent_path.resolve())):
+            if not resolved.is_relative_to(self._agent_home_resolved):
                 raise PermissionError(f"Path escapes agent home: {path}")
             return resolved
         return Path(path)
@@ -63,4 +65,5 @@ class ToolContext:
     def emit(self, event_type: str, **data: Any):
         """Emit an event via the event bus."""
         if self.event_bus:
-            self.event_bus.emit_simple(event_type, self.agent_id, **data)
+            # Build the Event here so the kwargs dict becomes its payload as-is
+            self.event_bus.emit(Event(type=event_type, agent_id=self.agent_id, data=data))
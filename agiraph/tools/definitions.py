@@ -123,6 +123,7 @@ READ_FILE = ToolDef(
         },
         "required": ["path"],
     },
+    idempotent=True,
 )
 
 WRITE_FILE = ToolDef(
@@ -149,6 +150,7 @@ LIST_FILES = ToolDef(
         },
         "required": ["path"],
     },
+    idempotent=True,
 )
 
 READ_REF = ToolDef(
@@ -161,6 +163,7 @@ READ_REF = ToolDef(
         },
         "required": ["ref_name"],
     },
+    idempotent=True,
 )
 
 # ---------------------------------------------------------------------------
@@ -203,6 +206,7 @@ WEB_SEARCH = ToolDef(
         "Be specific in queries. Search multiple times with different angles.\n"
         "Don't trust snippets blindly — use web_fetch on promising URLs."
     ),
+    idempotent=True,
 )
 
 WEB_FETCH = ToolDef(
@@ -216,6 +220,7 @@ WEB_FETCH = ToolDef(
         "required": ["url"],
     },
     guidance="Content truncated at ~15K chars. Extract data and write to scratch/.",
+    idempotent=True,
 )
 
 # ---------------------------------------------------------------------------
@@ -246,6 +251,7 @@ MEMORY_READ = ToolDef(
         },
         "required": ["path"],
     },
+    idempotent=True,
 )
 
 MEMORY_SEARCH = ToolDef(
@@ -258,6 +264,7 @@ MEMORY_SEARCH = ToolDef(
         },
         "required": ["query"],
     },
+    idempotent=True,
 )
 
 # ---------------------------------------------------------------------------
@@ -3,18 +3,29 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
+import contextlib
 import logging
 import os
-import shutil
+import re
+import signal
 import subprocess
+from collections import defaultdict
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import httpx
 
+try:
+    from markdownify import markdownify
+except ImportError:
+    markdownify = None
+
 from agiraph.config import BRAVE_API_KEY, MAX_MEMORY_INLINE, SERPER_API_KEY, SEARCH_PROVIDER
+from agiraph.io_utils import copy_entry, ensure_dir, read_head, run_io, write_text
 from agiraph.models import Message, Trigger, TriggerAction, WorkNode, Worker, generate_id
+from agiraph.serialization import dumps, dumps_str, loads
 
 if TYPE_CHECKING:
     from agiraph.tools.context import ToolContext
@@ -35,43 +46,31 @@ async def impl_publish(context: ToolContext, summary: str) -> str:
 
     scratch = node.data_dir / "scratch"
     published = node.data_dir / "published"
-    published.mkdir(parents=True, exist_ok=True)
+    await run_io(ensure_dir, published)
 
-    if scratch.exists():
-        for f in scratch.iterdir():
-            dest = published / f.name
-            if f.is_dir():
-                shutil.copytree(f, dest, dirs_exist_ok=True)
-            else:
-                shutil.copy2(f, dest)
+    # Copy independent scratch entries concurrently on the I/O pool
+    entries = await run_io(_list_entries, scratch)
+    await asyncio.gather(*(run_io(copy_entry, f, published / f.name) for f in entries))
 
     # Write status
-    (node.data_dir / "_status.md").write_text(f"COMPLETED\n\n{summary}")
+    await run_io((node.data_dir / "_status.md").write_text, f"COMPLETED\n\n{summary}")
     node.status = "completed"
     node.result = summary
 
-    # Update worker memory
+    # Update worker memory (buffered; flushed in batches)
     if context.worker and context.worker.worker_dir:
         mem_file = context.worker.worker_dir / "memory.md"
-        mem_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(mem_file, "a") as f:
-            f.write(f"\n## Node: {node.id}\n{summary}\n")
+        buf = _MEM_BUF[mem_file]
+        buf.append(f"\n## Node: {node.id}\n{summary}\n")
+        if sum(map(len, buf)) >= _MEM_FLUSH_THRESH:
+            await flush_worker_memory(mem_file)
 
     # Mark worker idle
     if context.worker:
         context.worker.status = "idle"
 
     # Collect published file names and previews
-    published_files = []
-    if published.exists():
-        for f in published.iterdir():
-            if f.is_file() and not f.name.startswith("_"):
-                preview = ""
-                try:
-                    preview = f.read_text()[:500]
-                except Exception:
-                    pass
-                published_files.append({"name": f.name, "path": f"nodes/{node.id}/published/{f.name}", "preview": preview})
+    published_files = await run_io(_published_previews, published, node.id)
 
     # Emit event with file info
     context.emit(
@@ -83,6 +82,80 @@ async def impl_publish(context: ToolContext, summary: str) -> str:
     return f"Published. Node '{node.id}' complete. Files: {[pf['name'] for pf in published_files]}"
 
 
+def _list_entries(directory: Path) -> list[Path]:
+    return list(directory.iterdir()) if directory.exists() else []
+
+
+def _scan_entries(directory: Path) -> list[tuple[str, bool]]:
+    """(name, is_dir) pairs sorted by name; scandir reuses the dirent type, avoiding a stat per entry."""
+    with os.scandir(directory) as it:
+        entries = [(e.name, e.is_dir()) for e in it]
+    entries.sort()
+    return entries
+
+
+# Pending worker memory.md appends, written with one open+write per flush
+_MEM_BUF: defaultdict[Path, list[str]] = defaultdict(list)
+_MEM_FLUSH_THRESH = 32 * 1024
+# Latest in-progress append per memory.md; each flush's append waits for the previous one
+_MEM_WRITES: dict[Path, asyncio.Task] = {}
+
+
+async def flush_worker_memory(mem_file: Path | None = None):
+    """Write buffered memory appends for one worker (or all workers) to disk.
+
+    Must run before anything reads memory.md — the worker executor calls it
+    before building a prompt, and the agent calls it on finish/stop. Appends to
+    the same file land in flush order even when flushes overlap.
+
+    Trade-off: buffered entries live only in memory until flushed. A normal
+    interpreter exit writes them out (see _flush_worker_memory_at_exit), but a
+    crash or SIGKILL loses up to _MEM_FLUSH_THRESH bytes per worker.
+    """
+    for path in [mem_file] if mem_file else list(_MEM_BUF):
+        # Detach the buffer on the loop thread so concurrent appends land in a fresh list
+        chunks = _MEM_BUF.pop(path, None)
+        if not chunks:
+            continue
+        write = asyncio.ensure_future(_append_after(_MEM_WRITES.get(path), path, "".join(chunks)))
+        _MEM_WRITES[path] = write
+        try:
+            # shield: a cancelled caller must not abandon the write (or the ones queued behind it)
+            await asyncio.shield(write)
+        finally:
+            if _MEM_WRITES.get(path) is write:
+                del _MEM_WRITES[path]
+
+
+async def _append_after(previous: asyncio.Task | None, path: Path, text: str):
+    if previous is not None:
+        with contextlib.suppress(Exception):
+            await previous
+    await run_io(write_text, path, text, "a")
+
+
+@atexit.register
+def _flush_worker_memory_at_exit():
+    """Last-chance synchronous flush for exits that skip agent finish/stop and the server lifespan."""
+    for path, chunks in list(_MEM_BUF.items()):
+        with contextlib.suppress(OSError):
+            write_text(path, "".join(chunks), "a")
+    _MEM_BUF.clear()
+
+
+def _published_previews(published: Path, node_id: str) -> list[dict]:
+    previews = []
+    for f in _list_entries(published):
+        if f.is_file() and not f.name.startswith("_"):
+            preview = ""
+            try:
+                preview = f.read_text()[:500]
+            except Exception:
+                pass
+            previews.append({"name": f.name, "path": f"nodes/{node_id}/published/{f.name}", "preview": preview})
+    return previews
+
+
 async def impl_checkpoint(context: ToolContext, summary: str) -> str:
     """Signal stage completion."""
     if context.node:
@@ -106,19 +179,19 @@ async def impl_create_work_node(context: ToolContext, task: str, deps: list[str]
     run_dir = context.run_dir
     if run_dir:
         node.data_dir = run_dir / "nodes" / node.id
-        node.data_dir.mkdir(parents=True, exist_ok=True)
-        (node.data_dir / "scratch").mkdir(exist_ok=True)
-        (node.data_dir / "published").mkdir(exist_ok=True)
+        ensure_dir(node.data_dir)
+        ensure_dir(node.data_dir / "scratch")
+        ensure_dir(node.data_dir / "published")
         (node.data_dir / "_spec.md").write_text(task)
         if refs:
-            (node.data_dir / "_refs.json").write_text(json.dumps(refs, indent=2))
+            (node.data_dir / "_refs.json").write_bytes(dumps(refs, indent=True))
 
     context.board.add(node)
     if context.node:
         context.node.children.append(node.id)
 
     context.emit("node.created", node_id=node.id, task=task[:100])
-    return json.dumps({"node_id": node.id, "status": "created"})
+    return dumps_str({"node_id": node.id, "status": "created"})
 
 
 async def impl_suggest_next(context: ToolContext, suggestion: str) -> str:
@@ -150,10 +223,7 @@ async def impl_check_messages(context: ToolContext) -> str:
     messages = context.message_bus.receive(entity_id)
     if not messages:
         return "No new messages."
-    parts = []
-    for m in messages:
-        parts.append(f"FROM {m.from_id}: {m.content}")
-    return "\n---\n".join(parts)
+    return "\n---\n".join(f"FROM {m.from_id}: {m.content}" for m in messages)
 
 
 async def impl_ask_human(context: ToolContext, question: str, channel: str = "cli") -> str:
@@ -170,10 +240,9 @@ async def impl_ask_human(context: ToolContext, question: str, channel: str = "cl
 
     # Block waiting for response
     try:
-        response = await asyncio.wait_for(
-            context.human_response_queue.get(),
-            timeout=context.human_timeout,
-        )
+        # asyncio.timeout scopes the deadline to this task — no wrapper task as with wait_for
+        async with asyncio.timeout(context.human_timeout):
+            response = await context.human_response_queue.get()
     except asyncio.TimeoutError:
         if context.worker:
             context.worker.status = "busy"
@@ -197,19 +266,18 @@ async def impl_read_file(context: ToolContext, path: str) -> str:
     if not full_path.exists():
         return f"Error: File not found: {path}"
     try:
-        content = full_path.read_text()
-        if len(content) > 50000:
-            content = content[:50000] + "\n\n[... truncated ...]"
-        return content
+        return await run_io(read_head, full_path, _READ_LIMIT)
     except Exception as e:
         return f"Error reading {path}: {e}"
 
 
+_READ_LIMIT = 50_000  # chars returned by read_file / read_ref
+
+
 async def impl_write_file(context: ToolContext, path: str, content: str) -> str:
     """Write a file to the workspace."""
     full_path = context.resolve_path(path)
-    full_path.parent.mkdir(parents=True, exist_ok=True)
-    full_path.write_text(content)
+    write_text(full_path, content)
     # Emit a file.written event so the frontend can show a link/preview
     context.emit("file.written", path=path, size=len(content), preview=content[:500])
     return f"Written {len(content)} chars to {path}"
@@ -223,11 +291,9 @@ async def impl_list_files(context: ToolContext, path: str) -> str:
     if not full_path.is_dir():
         return f"Error: Not a directory: {path}"
 
-    entries = []
-    for item in sorted(full_path.iterdir()):
-        prefix = "📁 " if item.is_dir() else "📄 "
-        entries.append(f"{prefix}{item.name}")
-    return "\n".join(entries) if entries else "(empty directory)"
+    entries = await run_io(_scan_entries, full_path)
+    lines = [f"{'📁 ' if is_dir else '📄 '}{name}" for name, is_dir in entries]
+    return "\n".join(lines) if lines else "(empty directory)"
 
 
 async def impl_read_ref(context: ToolContext, ref_name: str) -> str:
@@ -235,11 +301,10 @@ async def impl_read_ref(context: ToolContext, ref_name: str) -> str:
     if not context.node or not context.node.data_dir:
         return "Error: No active node."
 
-    refs_file = context.node.data_dir / "_refs.json"
-    if not refs_file.exists():
+    refs = _load_refs(context.node.data_dir / "_refs.json")
+    if refs is None:
         return "Error: No _refs.json found."
 
-    refs = json.loads(refs_file.read_text())
     ref_path = refs.get(ref_name)
     if not ref_path:
         return f"Error: Ref '{ref_name}' not found. Available: {list(refs.keys())}"
@@ -248,10 +313,25 @@ async def impl_read_ref(context: ToolContext, ref_name: str) -> str:
     if not full_path.exists():
         return f"Error: Referenced file not found: {ref_path}"
 
-    content = full_path.read_text()
-    if len(content) > 50000:
-        content = content[:50000] + "\n\n[... truncated ...]"
-    return content
+    return await run_io(read_head, full_path, _READ_LIMIT)
+
+
+# Parsed _refs.json by path, keyed on (mtime, size) so edits are still picked up
+_REFS_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def _load_refs(refs_file: Path) -> dict | None:
+    try:
+        st = refs_file.stat()
+    except FileNotFoundError:
+        return None
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _REFS_CACHE.get(refs_file)
+    if cached and cached[0] == version:
+        return cached[1]
+    refs = loads(refs_file.read_bytes())
+    _REFS_CACHE[refs_file] = (version, refs)
+    return refs
 
 
 # ---------------------------------------------------------------------------
@@ -259,6 +339,25 @@ async def impl_read_ref(context: ToolContext, ref_name: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+_BASH_OUTPUT_LIMIT = 10_000
+
+
+async def _drain(reader: asyncio.StreamReader, buf: bytearray, cap: int) -> bool:
+    """Read a pipe to EOF, keeping at most `cap` bytes; return True if any were discarded.
+
+    The rest is discarded rather than buffered, so a chatty command costs
+    O(cap) memory; the pipe is still drained so the command never blocks on it.
+    """
+    overflowed = False
+    while chunk := await reader.read(65_536):
+        room = cap - len(buf)
+        if len(chunk) > room:
+            overflowed = True
+        if room > 0:
+            buf += chunk[:room]
+    return overflowed
+
+
 async def impl_bash(context: ToolContext, command: str, timeout: int = 120) -> str:
     """Execute a shell command."""
     cwd = None
@@ -275,14 +374,28 @@ async def impl_bash(context: ToolContext, command: str, timeout: int = 120) -> s
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             cwd=cwd,
+            start_new_session=True,  # own process group, so a timeout kills the whole pipeline
         )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
-        output = (stdout.decode() + stderr.decode()).strip()
-        if len(output) > 10000:
-            output = output[:10000] + "\n\n[... truncated ...]"
+        stdout, stderr = bytearray(), bytearray()
+        # The limit is in characters; 4 bytes per char (UTF-8's maximum) keeps
+        # the byte cap from cutting decoded output short of it
+        byte_cap = 4 * _BASH_OUTPUT_LIMIT
+        try:
+            async with asyncio.timeout(timeout):
+                overflowed = any(await asyncio.gather(
+                    _drain(proc.stdout, stdout, byte_cap),
+                    _drain(proc.stderr, stderr, byte_cap),
+                ))
+                await proc.wait()
+        except asyncio.TimeoutError:
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(proc.pid, signal.SIGKILL)
+            await proc.wait()
+            return f"Command timed out after {timeout}s"
+        output = (stdout.decode(errors="replace") + stderr.decode(errors="replace")).strip()
+        if overflowed or len(output) > _BASH_OUTPUT_LIMIT:
+            output = output[:_BASH_OUTPUT_LIMIT] + "\n\n[... truncated ...]"
         return output if output else "(no output)"
-    except asyncio.TimeoutError:
-        return f"Command timed out after {timeout}s"
     except Exception as e:
         return f"Error: {e}"
 
@@ -307,16 +420,41 @@ async def impl_web_search(context: ToolContext, query: str) -> str:
         return f"Search error: {e}"
 
 
-async def _brave_search(query: str) -> str:
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            "https://api.search.brave.com/res/v1/web/search",
-            params={"q": query, "count": 5},
-            headers={"X-Subscription-Token": BRAVE_API_KEY, "Accept": "application/json"},
+# One pooled client for all outbound HTTP, so repeated searches/fetches reuse TCP+TLS connections
+_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+
+def _http_client() -> httpx.AsyncClient:
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            follow_redirects=True,
             timeout=30,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
         )
-        resp.raise_for_status()
-        data = resp.json()
+    return _HTTP_CLIENT
+
+
+async def close_http_client():
+    """Close the shared HTTP client (called on server shutdown)."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
+_BRAVE_HEADERS = {"X-Subscription-Token": BRAVE_API_KEY, "Accept": "application/json"}
+_SERPER_HEADERS = {"X-API-KEY": SERPER_API_KEY, "Content-Type": "application/json"}
+
+
+async def _brave_search(query: str) -> str:
+    resp = await _http_client().get(
+        "https://api.search.brave.com/res/v1/web/search",
+        params={"q": query, "count": 5},
+        headers=_BRAVE_HEADERS,
+    )
+    resp.raise_for_status()
+    data = resp.json()
 
     results = data.get("web", {}).get("results", [])
     if not results:
@@ -329,15 +467,13 @@ async def _brave_search(query: str) -> str:
 
 
 async def _serper_search(query: str) -> str:
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            "https://google.serper.dev/search",
-            json={"q": query, "num": 5},
-            headers={"X-API-KEY": SERPER_API_KEY, "Content-Type": "application/json"},
-            timeout=30,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await _http_client().post(
+        "https://google.serper.dev/search",
+        content=dumps({"q": query, "num": 5}),
+        headers=_SERPER_HEADERS,
+    )
+    resp.raise_for_status()
+    data = resp.json()
 
     results = data.get("organic", [])
     if not results:
@@ -349,26 +485,28 @@ async def _serper_search(query: str) -> str:
     return "\n---\n".join(formatted)
 
 
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
 async def impl_web_fetch(context: ToolContext, url: str) -> str:
     """Fetch a webpage and convert to markdown."""
     context.emit("tool.called", tool="web_fetch", url=url)
 
     try:
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            resp = await client.get(url, timeout=30, headers={
-                "User-Agent": "Mozilla/5.0 (compatible; Agiraph/2.0)"
-            })
-            resp.raise_for_status()
-            html = resp.text
-
-        # Convert HTML to markdown
-        try:
-            from markdownify import markdownify
-            md = markdownify(html, heading_style="ATX", strip=["script", "style", "nav", "footer"])
-        except ImportError:
+        resp = await _http_client().get(url, headers={
+            "User-Agent": "Mozilla/5.0 (compatible; Agiraph/2.0)"
+        })
+        resp.raise_for_status()
+        html = resp.text
+
+        # Convert HTML to markdown — CPU-bound, so keep it off the event loop
+        if markdownify is not None:
+            md = await asyncio.to_thread(
+                markdownify, html, heading_style="ATX", strip=["script", "style", "nav", "footer"],
+            )
+        else:
             # Fallback: strip tags naively
-            import re
-            md = re.sub(r"<[^>]+>", "", html)
+            md = await asyncio.to_thread(_TAG_RE.sub, "", html)
 
         md = md.strip()
         if len(md) > 15000:
@@ -385,17 +523,16 @@ async def impl_web_fetch(context: ToolContext, url: str) -> str:
 
 async def impl_memory_write(context: ToolContext, path: str, content: str) -> str:
     """Write to agent long-term memory."""
-    memory_dir = context.agent_path / "memory"
+    memory_dir = context.memory_dir
     full_path = memory_dir / path
-    full_path.parent.mkdir(parents=True, exist_ok=True)
-    full_path.write_text(content)
+    write_text(full_path, content)
     context.emit("memory.written", path=path)
     return f"Written to memory/{path}"
 
 
 async def impl_memory_read(context: ToolContext, path: str) -> str:
     """Read from agent long-term memory."""
-    memory_dir = context.agent_path / "memory"
+    memory_dir = context.memory_dir
     full_path = memory_dir / path
     if not full_path.exists():
         return f"Error: Memory file not found: memory/{path}"
@@ -404,53 +541,74 @@ async def impl_memory_read(context: ToolContext, path: str) -> str:
 
 async def impl_memory_search(context: ToolContext, query: str) -> str:
     """Search memory files for relevant sections."""
-    memory_dir = context.agent_path / "memory"
+    memory_dir = context.memory_dir
     if not memory_dir.exists():
         return "No memory files found."
 
-    all_files = list(memory_dir.rglob("*.md"))
+    all_files, total_size = await run_io(_scan_memory, memory_dir)
     if not all_files:
         return "No memory files found."
 
-    total_size = sum(f.stat().st_size for f in all_files)
+    # Read every file concurrently on the I/O pool rather than one at a time on the loop
+    try:
+        texts = await asyncio.gather(*(run_io(f.read_text) for f in all_files))
+    except FileNotFoundError:
+        # A file was removed between the scan and the read — rescan once
+        all_files, total_size = await run_io(_scan_memory, memory_dir)
+        texts = await asyncio.gather(*(run_io(f.read_text) for f in all_files))
 
     # If small enough, return everything
     if total_size < MAX_MEMORY_INLINE:
         parts = []
-        for f in all_files:
+        for f, text in zip(all_files, texts):
             rel = f.relative_to(memory_dir)
-            parts.append(f"**{rel}**\n{f.read_text()}")
+            parts.append(f"**{rel}**\n{text}")
         return "\n\n---\n\n".join(parts)
 
     # Otherwise: grep for keywords, return matching sections
-    keywords = query.lower().split()
+    keywords = sorted(set(query.lower().split()), key=len, reverse=True)
     results = []
-    for md_file in all_files:
-        sections = _split_by_headers(md_file.read_text())
-        for section in sections:
-            if any(kw in section.lower() for kw in keywords):
-                results.append((md_file.relative_to(memory_dir), section))
+    if keywords:
+        # One compiled alternation, matched case-insensitively — no per-section lower() copies
+        pattern = re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+        for md_file, text in zip(all_files, texts):
+            for start, end in _iter_sections(text):
+                # Search in place; only matching sections are sliced out
+                if pattern.search(text, start, end):
+                    results.append((md_file.relative_to(memory_dir), text[start:end]))
+                    if len(results) == 10:
+                        break
+            if len(results) == 10:
+                break
 
     if not results:
         return "No matching memory found."
 
-    return "\n\n---\n\n".join(f"**{path}**\n{section}" for path, section in results[:10])
+    return "\n\n---\n\n".join(f"**{path}**\n{section}" for path, section in results)
 
 
-def _split_by_headers(text: str) -> list[str]:
-    """Split markdown into sections at ## or ### headers."""
-    sections = []
-    current: list[str] = []
-    for line in text.split("\n"):
-        if line.startswith("## ") or line.startswith("### "):
-            if current:
-                sections.append("\n".join(current))
-            current = [line]
-        else:
-            current.append(line)
-    if current:
-        sections.append("\n".join(current))
-    return sections
+def _scan_memory(memory_dir: Path) -> tuple[list[Path], int]:
+    """All markdown files under memory/ and their combined size.
+
+    Scanned fresh on every search: memory files are also written by write_file,
+    bash and other workers, so no cached listing or size can be trusted.
+    """
+    files = list(memory_dir.rglob("*.md"))
+    total_size = sum(f.stat().st_size for f in files)
+    return files, total_size
+
+
+_HEADER_RE = re.compile(r"^#{2,3} ", re.MULTILINE)
+
+
+def _iter_sections(text: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) offsets of markdown sections split at ## or ### headers."""
+    start = 0
+    for m in _HEADER_RE.finditer(text):
+        if m.start() > 0:
+            yield start, m.start() - 1  # exclude the newline before the header
+        start = m.start()
+    yield start, len(text)
 
 
 # ---------------------------------------------------------------------------
@@ -467,14 +625,14 @@ async def impl_schedule(context: ToolContext, type: str, config: dict, action: s
         action=TriggerAction(type="wake_agent", payload={"task": action}),
         metadata=config,
     )
-    context.trigger_store.append(trigger)
+    context.trigger_store.add(trigger)
     context.emit("trigger.created", trigger_id=trigger.id, type=type)
-    return json.dumps({"trigger_id": trigger.id, "type": type, "status": "active"})
+    return dumps_str({"trigger_id": trigger.id, "type": type, "status": "active"})
 
 
 async def impl_list_triggers(context: ToolContext) -> str:
     """List active triggers."""
-    active = [t for t in context.trigger_store if t.status == "active"]
+    active = context.trigger_store.active()
     if not active:
         return "No active triggers."
     parts = []
@@ -485,10 +643,8 @@ async def impl_list_triggers(context: ToolContext) -> str:
 
 async def impl_cancel_trigger(context: ToolContext, trigger_id: str) -> str:
     """Cancel a trigger."""
-    for t in context.trigger_store:
-        if t.id == trigger_id:
-            t.status = "expired"
-            return f"Trigger {trigger_id} cancelled."
+    if context.trigger_store.cancel(trigger_id):
+        return f"Trigger {trigger_id} cancelled."
     return f"Error: Trigger {trigger_id} not found."
 
 
@@ -497,6 +653,14 @@ async def impl_cancel_trigger(context: ToolContext, trigger_id: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _scaffold_worker(worker_dir: Path, name: str, role: str):
+    ensure_dir(worker_dir)
+    (worker_dir / "identity.md").write_text(f"# {name}\n\n{role}\n")
+    (worker_dir / "memory.md").write_text("")
+    (worker_dir / "notebook.md").write_text("")
+    (worker_dir / "history.json").write_text("[]")
+
+
 async def impl_spawn_worker(context: ToolContext, name: str, role: str, type: str = "harnessed",
                             model: str | None = None, max_iterations: int = 20) -> str:
     """Spawn a new worker."""
@@ -512,16 +676,12 @@ async def impl_spawn_worker(context: ToolContext, name: str, role: str, type: st
     # Create worker directory
     if context.run_dir:
         worker.worker_dir = context.run_dir / "workers" / worker.id
-        worker.worker_dir.mkdir(parents=True, exist_ok=True)
-        (worker.worker_dir / "identity.md").write_text(f"# {name}\n\n{role}\n")
-        (worker.worker_dir / "memory.md").write_text("")
-        (worker.worker_dir / "notebook.md").write_text("")
-        (worker.worker_dir / "history.json").write_text("[]")
+        await run_io(_scaffold_worker, worker.worker_dir, name, role)
 
     context.worker_pool.add(worker)
     context.message_bus.register(name)
     context.emit("worker.spawned", worker_id=worker.id, name=name, role=role)
-    return json.dumps({"worker_id": worker.id, "name": name, "status": "idle"})
+    return dumps_str({"worker_id": worker.id, "name": name, "status": "idle"})
 
 
 async def impl_assign_worker(context: ToolContext, node_id: str, worker_id: str) -> str:
@@ -544,12 +704,12 @@ async def impl_check_board(context: ToolContext) -> str:
     """Show all nodes and their status."""
     if not context.board.nodes:
         return "Work board is empty."
-    lines = []
-    for n in context.board.nodes.values():
-        worker_info = f" (→ {n.assigned_worker})" if n.assigned_worker else ""
-        result_preview = f" | Result: {n.result[:80]}..." if n.result else ""
-        lines.append(f"- [{n.status.upper()}] {n.id}: {n.task[:80]}{worker_info}{result_preview}")
-    return "\n".join(lines)
+    return "\n".join(
+        f"- [{n.status.upper()}] {n.id}: {n.task[:80]}"
+        f"{f' (→ {n.assigned_worker})' if n.assigned_worker else ''}"
+        f"{f' | Result: {n.result[:80]}...' if n.result else ''}"
+        for n in context.board.nodes.values()
+    )
 
 
 async def impl_reconvene(context: ToolContext, assessment: str) -> str:
@@ -558,19 +718,25 @@ async def impl_reconvene(context: ToolContext, assessment: str) -> str:
 
     # Gather all node outputs
     completed = [n for n in context.board.nodes.values() if n.status == "completed"]
+    # List every node's published/ concurrently rather than one readdir at a time on the loop
+    file_lists = await asyncio.gather(*(run_io(_list_published, n) for n in completed))
     outputs = []
-    for n in completed:
-        published_dir = n.data_dir / "published" if n.data_dir else None
-        files_info = ""
-        if published_dir and published_dir.exists():
-            files = list(published_dir.iterdir())
-            files_info = f" | Files: {[f.name for f in files]}"
+    for n, files in zip(completed, file_lists):
+        files_info = f" | Files: {files}" if files is not None else ""
         outputs.append(f"- {n.id}: {n.result or '(no result)'}{files_info}")
 
     return f"Stage reconvened.\n\nAssessment: {assessment}\n\nCompleted nodes:\n" + "\n".join(outputs)
 
 
+def _list_published(node: WorkNode) -> list[str] | None:
+    published_dir = node.data_dir / "published" if node.data_dir else None
+    if not published_dir or not published_dir.exists():
+        return None
+    return [f.name for f in published_dir.iterdir()]
+
+
 async def impl_finish(context: ToolContext, summary: str) -> str:
     """Goal achieved — stop the agent."""
+    await flush_worker_memory()
     context.emit("agent.completed", summary=summary)
     return f"AGENT_FINISHED: {summary}"
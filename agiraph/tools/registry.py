@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import inspect
 import logging
 from typing import Any, Callable, Awaitable
 
@@ -18,43 +19,50 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, ToolDef] = {}
-        self._impls: dict[str, ToolImpl] = {}
+        # name -> (impl, is_coroutine_function), resolved once at registration
+        self._impls: dict[str, tuple[ToolImpl, bool]] = {}
+        # Filtered views, rebuilt lazily after each register()
+        self._worker_tools: tuple[ToolDef, ...] | None = None
+        self._all_tools: tuple[ToolDef, ...] | None = None
 
     def register(self, tool_def: ToolDef, impl: ToolImpl):
         """Register a tool definition with its implementation."""
         self._tools[tool_def.name] = tool_def
-        self._impls[tool_def.name] = impl
+        self._impls[tool_def.name] = (impl, inspect.iscoroutinefunction(impl))
+        self._worker_tools = self._all_tools = None
 
     def get_def(self, name: str) -> ToolDef | None:
         return self._tools.get(name)
 
-    def get_all(self, include_coordinator: bool = False) -> list[ToolDef]:
+    def get_all(self, include_coordinator: bool = False) -> tuple[ToolDef, ...]:
         """Get all tool definitions, optionally including coordinator-only tools."""
-        return [
-            t for t in self._tools.values()
-            if include_coordinator or not t.coordinator_only
-        ]
+        return self.get_coordinator_tools() if include_coordinator else self.get_worker_tools()
 
-    def get_worker_tools(self) -> list[ToolDef]:
-        """Get tools available to regular workers."""
-        return [t for t in self._tools.values() if not t.coordinator_only]
+    def get_worker_tools(self) -> tuple[ToolDef, ...]:
+        """Get tools available to regular workers (cached; immutable)."""
+        if self._worker_tools is None:
+            self._worker_tools = tuple(t for t in self._tools.values() if not t.coordinator_only)
+        return self._worker_tools
 
-    def get_coordinator_tools(self) -> list[ToolDef]:
-        """Get all tools including coordinator-only."""
-        return list(self._tools.values())
+    def get_coordinator_tools(self) -> tuple[ToolDef, ...]:
+        """Get all tools including coordinator-only (cached; immutable)."""
+        if self._all_tools is None:
+            self._all_tools = tuple(self._tools.values())
+        return self._all_tools
 
     async def dispatch(self, tool_call: ToolCall, context: Any) -> str:
         """Execute a tool call and return the result string."""
-        impl = self._impls.get(tool_call.name)
-        if not impl:
+        entry = self._impls.get(tool_call.name)
+        if not entry:
             return f"Error: Unknown tool '{tool_call.name}'"
+        impl, is_coro = entry
 
         try:
             result = impl(context=context, **tool_call.args)
             # Handle both sync and async implementations
-            if hasattr(result, "__await__"):
+            if is_coro:
                 result = await result
-            return str(result)
+            return result if type(result) is str else str(result)
         except Exception as e:
             logger.error(f"Tool '{tool_call.name}' failed: {e}", exc_info=True)
             return f"Error executing {tool_call.name}: {e}"
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import logging
-import shutil
+import os
+import re
 import time
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from agiraph.config import CONVERSATION_WINDOW
+from agiraph.events import preview_args
+from agiraph.io_utils import copy_entry, read_head, run_io, write_text
 from agiraph.models import ModelResponse, ToolCall, WorkNode, Worker
 from agiraph.providers import create_provider
+from agiraph.serialization import dumps
 from agiraph.tools.context import ToolContext
+from agiraph.tools.implementations import flush_worker_memory
 
 if TYPE_CHECKING:
     from agiraph.events import EventBus
@@ -22,9 +29,85 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+_OPERATING_RULES = (
+    "## Operating Rules\n\n"
+    "- Write important findings to files (scratch/). Your conversation may be compacted.\n"
+    "- Call publish() when your work is done. This moves scratch/ to published/.\n"
+    "- Check messages periodically with check_messages.\n"
+    "- Be specific in outputs. Quality over speed.\n"
+    "- If stuck after 3 attempts, message the coordinator or ask the human.\n"
+)
+
+
+def _file_key(path: Path) -> tuple[int, int] | None:
+    """(mtime_ns, size) of a file, or None if it doesn't exist — a cheap change detector."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=128)
+def _assemble_system_prompt(
+    worker_dir: str | None,
+    identity_key: tuple[int, int] | None,
+    memory_key: tuple[int, int] | None,
+) -> str:
+    """Join identity, memory, and operating rules.
+
+    Cached on the files' stat keys, so a worker's prompt is only re-read when
+    identity.md or memory.md changes — and stays byte-identical (prompt-cache
+    friendly) while they don't.
+    """
+    sections = []
+
+    # Worker identity
+    if identity_key is not None:
+        sections.append((Path(worker_dir) / "identity.md").read_text())
+
+    # Worker memory
+    if memory_key is not None:
+        mem = (Path(worker_dir) / "memory.md").read_text().strip()
+        if mem:
+            sections.append(f"## Your Memory (From Past Work)\n\n{mem}")
+
+    # Operating rules
+    sections.append(_OPERATING_RULES)
+
+    return "\n\n---\n\n".join(sections)
+
+
+_REF_PREVIEW_CHARS = 5000  # per-ref budget in the initial message; the full file stays readable via read_ref
+
+
+def _read_ref_text(path: Path) -> str | None:
+    """Read the head of a ref file for the initial message; None if missing.
+
+    Only the first _REF_PREVIEW_CHARS are read from disk, so a huge upstream
+    artifact costs a few KB rather than its full size.
+    """
+    if not path.exists():
+        return None
+    return read_head(path, _REF_PREVIEW_CHARS)
+
+
+# Outbox format: blocks separated by "---" lines, each optionally addressed with a "TO: name" line
+_OUTBOX_SEP_RE = re.compile(r"^---[ \t]*$", re.MULTILINE)
+_OUTBOX_TO_RE = re.compile(r"^TO:(.*)(?:\n|$)", re.MULTILINE)
+
+
+async def _drain_tail(stream: asyncio.StreamReader, tail: deque[bytes]):
+    """Read a pipe to EOF, keeping only the most recent chunks in `tail`."""
+    while chunk := await stream.read(4096):
+        tail.append(chunk)
+
+
 class WorkerExecutor:
     """Executes a work node using a harnessed worker (ReAct loop)."""
 
+    TOOL_CACHE_SIZE = 256
+
     def __init__(
         self,
         worker: Worker,
@@ -39,9 +122,30 @@ class WorkerExecutor:
         self.provider = create_provider(worker.model or "anthropic/claude-sonnet-4-5")
         self.conversation: list[dict] = []
         self.finished = False
+        self._log_fh = None  # log.jsonl, opened on first iteration and kept for the whole run
+        self._dispatching = False  # inside a tool call (for the stop note)
+        self._archived = 0  # messages moved out of the window into conversation_archive.jsonl
+        # Results of idempotent tools for this node, keyed by (name, canonical args); LRU order
+        self._tool_cache: OrderedDict[tuple[str, bytes], str] = OrderedDict()
 
     async def execute(self) -> str:
         """Run the ReAct loop until publish, max iterations, or error."""
+        try:
+            return await self._run()
+        except asyncio.CancelledError:
+            # STOP pressed — exit gracefully, wherever in the loop it landed
+            reason = "Stopped by user during tool dispatch" if self._dispatching else "Stopped by user"
+            self._save_failure_notes(reason, "")
+            self.node.status = "failed"
+            self.node.result = "Stopped by user"
+            self.worker.status = "idle"
+            return self.node.result
+        finally:
+            if self._log_fh is not None:
+                self._log_fh.close()
+                self._log_fh = None
+
+    async def _run(self) -> str:
         self.node.status = "running"
         self.worker.status = "busy"
 
@@ -52,13 +156,18 @@ class WorkerExecutor:
             worker_name=self.worker.name,
         )
 
-        # Build system prompt
-        system = self._build_system_prompt()
+        # Build system prompt (publish() buffers memory appends — flush before reading them)
+        if self.worker.worker_dir:
+            await flush_worker_memory(self.worker.worker_dir / "memory.md")
+        system, initial = await asyncio.gather(
+            run_io(self._build_system_prompt),
+            self._build_initial_message(),
+        )
         tools = self.registry.get_worker_tools()
 
         # Initial user message with the spec
         self.conversation = [
-            {"role": "user", "content": self._build_initial_message()},
+            {"role": "user", "content": initial},
         ]
 
         for iteration in range(self.worker.max_iterations):
@@ -75,13 +184,6 @@ class WorkerExecutor:
                     system=system,
                     max_tokens=4096,
                 )
-            except asyncio.CancelledError:
-                # STOP pressed — exit gracefully
-                self._save_failure_notes("Stopped by user", "")
-                self.node.status = "failed"
-                self.node.result = "Stopped by user"
-                self.worker.status = "idle"
-                return self.node.result
             except Exception as e:
                 logger.error(f"LLM call failed for {self.worker.name}: {e}")
                 self.context.emit("tool.error", error=str(e), worker=self.worker.name)
@@ -94,12 +196,6 @@ class WorkerExecutor:
                         system=system,
                         max_tokens=4096,
                     )
-                except asyncio.CancelledError:
-                    self._save_failure_notes("Stopped by user", "")
-                    self.node.status = "failed"
-                    self.node.result = "Stopped by user"
-                    self.worker.status = "idle"
-                    return self.node.result
                 except Exception as e2:
                     # Retry failed — save notes and notify coordinator
                     notes = self._save_failure_notes(str(e), str(e2))
@@ -140,20 +236,17 @@ class WorkerExecutor:
                         "tool.called",
                         tool=tc.name,
                         worker=self.worker.name,
-                        args={k: str(v)[:100] for k, v in tc.args.items()},
+                        args=preview_args(tc.args),
                     )
 
+                    self._dispatching = True
                     try:
-                        result = await self.registry.dispatch(tc, self.context)
-                    except asyncio.CancelledError:
-                        self._save_failure_notes("Stopped by user during tool dispatch", "")
-                        self.node.status = "failed"
-                        self.node.result = "Stopped by user"
-                        self.worker.status = "idle"
-                        return self.node.result
+                        result = await self._dispatch(tc)
                     except Exception as tool_err:
                         result = f"[Tool error] {tc.name}: {tool_err}"
                         self.context.emit("tool.error", tool=tc.name, error=str(tool_err), worker=self.worker.name)
+                    finally:
+                        self._dispatching = False
 
                     self.context.emit(
                         "tool.result",
@@ -185,6 +278,7 @@ class WorkerExecutor:
 
             # Log conversation for the node
             self._log_iteration(iteration, response)
+            await self._trim_conversation()
 
         # Reached max iterations without publishing
         if not self.finished:
@@ -213,48 +307,31 @@ class WorkerExecutor:
 
     def _build_system_prompt(self) -> str:
         """Build the worker's system prompt from identity, memory, and assignment."""
-        sections = []
-
-        # Worker identity
-        if self.worker.worker_dir:
-            identity_file = self.worker.worker_dir / "identity.md"
-            if identity_file.exists():
-                sections.append(identity_file.read_text())
-
-        # Worker memory
-        if self.worker.worker_dir:
-            memory_file = self.worker.worker_dir / "memory.md"
-            if memory_file.exists():
-                mem = memory_file.read_text().strip()
-                if mem:
-                    sections.append(f"## Your Memory (From Past Work)\n\n{mem}")
-
-        # Operating rules
-        sections.append(
-            "## Operating Rules\n\n"
-            "- Write important findings to files (scratch/). Your conversation may be compacted.\n"
-            "- Call publish() when your work is done. This moves scratch/ to published/.\n"
-            "- Check messages periodically with check_messages.\n"
-            "- Be specific in outputs. Quality over speed.\n"
-            "- If stuck after 3 attempts, message the coordinator or ask the human.\n"
+        worker_dir = self.worker.worker_dir
+        if not worker_dir:
+            return _assemble_system_prompt(None, None, None)
+        return _assemble_system_prompt(
+            str(worker_dir),
+            _file_key(worker_dir / "identity.md"),
+            _file_key(worker_dir / "memory.md"),
         )
 
-        return "\n\n---\n\n".join(sections)
-
-    def _build_initial_message(self) -> str:
+    async def _build_initial_message(self) -> str:
         """Build the initial user message with the task spec."""
         parts = [f"## Your Assignment\n\n{self.node.task}"]
 
-        # Include refs
+        # Include refs (read concurrently on the I/O pool)
         if self.node.refs and self.node.data_dir:
-            refs_content = []
-            for ref_name, ref_path in self.node.refs.items():
-                full_path = self.context.run_dir / ref_path if self.context.run_dir else Path(ref_path)
-                if full_path.exists():
-                    content = full_path.read_text()
-                    if len(content) > 5000:
-                        content = content[:5000] + "\n[... truncated ...]"
-                    refs_content.append(f"### {ref_name}\n\n{content}")
+            run_dir = self.context.run_dir
+            contents = await asyncio.gather(*(
+                run_io(_read_ref_text, run_dir / ref_path if run_dir else Path(ref_path))
+                for ref_path in self.node.refs.values()
+            ))
+            refs_content = [
+                f"### {ref_name}\n\n{content}"
+                for ref_name, content in zip(self.node.refs, contents)
+                if content is not None
+            ]
             if refs_content:
                 parts.append("## Input Data (From Upstream Nodes)\n\n" + "\n\n---\n\n".join(refs_content))
 
@@ -268,11 +345,37 @@ class WorkerExecutor:
 
         return "\n\n".join(parts)
 
+    async def _dispatch(self, tc: ToolCall) -> str:
+        """Dispatch a tool call, serving repeat calls of idempotent tools from the node's cache.
+
+        Any non-idempotent call (a write, bash, publish, ...) may change what
+        the read-only tools would return, so it clears the cache.
+        """
+        tool = self.registry.get_def(tc.name)
+        if tool is None or not tool.idempotent:
+            self._tool_cache.clear()
+            return await self.registry.dispatch(tc, self.context)
+
+        key = (tc.name, dumps(tc.args, sort_keys=True))
+        cached = self._tool_cache.get(key)
+        if cached is not None:
+            self._tool_cache.move_to_end(key)
+            self.context.emit("tool.cache_hit", tool=tc.name, worker=self.worker.name)
+            return cached
+
+        result = await self.registry.dispatch(tc, self.context)
+        if not result.startswith("Error"):
+            self._tool_cache[key] = result
+            if len(self._tool_cache) > self.TOOL_CACHE_SIZE:
+                self._tool_cache.popitem(last=False)
+        return result
+
     async def _yield_point(self):
         """Check for incoming messages before continuing."""
         if self.context.message_bus:
             messages = self.context.message_bus.receive(self.worker.name)
             if messages:
+                self._tool_cache.clear()  # other nodes may have changed what we've read
                 for msg in messages:
                     self.conversation.append({
                         "role": "user",
@@ -280,16 +383,46 @@ class WorkerExecutor:
                     })
         await asyncio.sleep(0)
 
+    async def _trim_conversation(self):
+        """Keep the conversation bounded: the spec, an archive note, and the newest turns.
+
+        Runs once the transcript exceeds twice CONVERSATION_WINDOW, so the
+        cached prompt prefix is only invalidated every ~window messages. The
+        cut is moved forward to an assistant turn so tool results always
+        follow their tool calls. Archived messages are appended to the node's
+        conversation_archive.jsonl.
+        """
+        head = 2 if self._archived else 1  # spec (+ archive note)
+        if len(self.conversation) - head <= 2 * CONVERSATION_WINDOW:
+            return
+        cut = len(self.conversation) - CONVERSATION_WINDOW
+        while cut < len(self.conversation) and self.conversation[cut].get("role") != "assistant":
+            cut += 1
+        if cut == len(self.conversation):
+            return
+
+        old = self.conversation[head:cut]
+        self._archived += len(old)
+        self.conversation = [
+            self.conversation[0],
+            {
+                "role": "user",
+                "content": f"[{self._archived} earlier messages were archived to conversation_archive.jsonl. "
+                "Rely on your scratch/ files for anything from before this point.]",
+            },
+            *self.conversation[cut:],
+        ]
+        if self.node.data_dir:
+            lines = b"".join(dumps(msg) + b"\n" for msg in old)
+            await run_io(_append_bytes, self.node.data_dir / "conversation_archive.jsonl", lines)
+
     def _response_to_msg(self, response: ModelResponse) -> dict:
         """Convert ModelResponse to a conversation message dict."""
         msg: dict[str, Any] = {"role": "assistant"}
         if response.text:
             msg["content"] = response.text
         if response.tool_calls:
-            msg["tool_calls"] = [
-                {"id": tc.id, "name": tc.name, "args": tc.args}
-                for tc in response.tool_calls
-            ]
+            msg["tool_calls"] = [tc.as_dict() for tc in response.tool_calls]
         if not msg.get("content") and not msg.get("tool_calls"):
             msg["content"] = ""
         # Preserve raw content blocks for multi-turn (web search results)
@@ -310,15 +443,17 @@ class WorkerExecutor:
             parts.append(f"**Second error**: {error2}")
 
         parts.append(f"\n## Conversation ({len(self.conversation)} messages)")
+        add = parts.append
         for msg in self.conversation:
             role = msg.get("role", "?")
             content = msg.get("content", "")
             if isinstance(content, str) and content:
-                parts.append(f"**[{role}]** {content[:500]}")
+                add(f"**[{role}]** {content[:500]}")
             elif msg.get("tool_calls"):
-                calls = msg["tool_calls"]
-                for tc in calls:
-                    parts.append(f"**[{role}:tool_call]** {tc.get('name', '?')}({json.dumps(tc.get('args', {}))[:200]})")
+                for tc in msg["tool_calls"]:
+                    # Slice the encoded bytes before decoding so bulky args are never turned into a full str
+                    args = dumps(tc.get("args", {}))[:200].decode(errors="replace")
+                    add(f"**[{role}:tool_call]** {tc.get('name', '?')}({args})")
 
         notes = "\n\n".join(parts)
 
@@ -331,7 +466,6 @@ class WorkerExecutor:
     def _log_iteration(self, iteration: int, response: ModelResponse):
         """Log iteration to the node's log file."""
         if self.node.data_dir:
-            log_file = self.node.data_dir / "log.jsonl"
             entry = {
                 "iteration": iteration,
                 "ts": time.time(),
@@ -340,8 +474,10 @@ class WorkerExecutor:
                 "tool_calls": [tc.name for tc in response.tool_calls],
                 "usage": {"input": response.usage.input_tokens, "output": response.usage.output_tokens},
             }
-            with open(log_file, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+            if self._log_fh is None:
+                self._log_fh = open(self.node.data_dir / "log.jsonl", "ab")
+            self._log_fh.write(dumps(entry) + b"\n")
+            self._log_fh.flush()
 
 
 class ClaudeCodeWorkerExecutor:
@@ -414,7 +550,7 @@ class ClaudeCodeWorkerExecutor:
                             "tool.called",
                             tool=f"cc:{tu.get('name', '?')}",
                             worker=self.worker.name,
-                            args={k: str(v)[:100] for k, v in tu.get("input", {}).items()}
+                            args=preview_args(tu["input"])
                             if isinstance(tu.get("input"), dict)
                             else {},
                         )
@@ -480,6 +616,7 @@ class AutonomousWorkerExecutor:
     """Executes a work node using an external agent (e.g., Claude Code CLI)."""
 
     POLL_INTERVAL = 5  # seconds
+    OUTPUT_TAIL_CHUNKS = 16  # 4 KB reads — keeps the last ~64 KB of each stream
 
     def __init__(
         self,
@@ -497,19 +634,17 @@ class AutonomousWorkerExecutor:
         self.worker.status = "busy"
 
         task_dir = self.node.data_dir / "scratch" if self.node.data_dir else Path("./scratch")
-        task_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write task files
-        (task_dir / "_task.md").write_text(self.node.task)
-        if self.node.refs:
-            (task_dir / "_context.json").write_text(json.dumps(self.node.refs))
-        (task_dir / "_inbox.md").write_text("")
-        (task_dir / "_outbox.md").write_text("")
+        # Write task files (all file I/O in this executor runs on the tools' I/O pool)
+        await run_io(_prepare_task_dir, task_dir, self.node.task, self.node.refs)
 
         # Build command
         cmd = self._build_command(task_dir)
         self.context.emit("worker.launched", worker=self.worker.name, command=" ".join(cmd))
 
+        # Keep draining both pipes so a chatty agent never blocks on a full pipe; only the tails are kept
+        stdout_tail: deque[bytes] = deque(maxlen=self.OUTPUT_TAIL_CHUNKS)
+        stderr_tail: deque[bytes] = deque(maxlen=self.OUTPUT_TAIL_CHUNKS)
+        drains: list[asyncio.Task] = []
         try:
             proc = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -517,43 +652,49 @@ class AutonomousWorkerExecutor:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
+            drains = [
+                asyncio.create_task(_drain_tail(proc.stdout, stdout_tail)),
+                asyncio.create_task(_drain_tail(proc.stderr, stderr_tail)),
+            ]
 
-            # Monitor
-            while proc.returncode is None:
-                # Bridge messages
-                self._bridge_messages(task_dir)
-
-                # Check for result
-                result_file = task_dir / "_result.md"
-                if result_file.exists():
-                    result = result_file.read_text()
-                    proc.terminate()
-                    await self._promote_to_published(task_dir)
-                    self.node.status = "completed"
-                    self.node.result = result
-                    self.worker.status = "idle"
-                    return result
+            # Monitor — wake on process exit or an incoming message; files are re-checked every POLL_INTERVAL
+            exited = asyncio.ensure_future(proc.wait())
+            try:
+                while proc.returncode is None:
+                    # Bridge messages
+                    await self._bridge_messages(task_dir)
+
+                    # Check for result
+                    result = await run_io(_read_if_exists, task_dir / "_result.md")
+                    if result is not None:
+                        proc.terminate()
+                        await self._promote_to_published(task_dir)
+                        self.node.status = "completed"
+                        self.node.result = result
+                        self.worker.status = "idle"
+                        return result
 
-                await asyncio.sleep(self.POLL_INTERVAL)
-                try:
-                    await asyncio.wait_for(proc.wait(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    pass
+                    await self._wait_for_activity(exited)
+            finally:
+                exited.cancel()
 
             # Process exited
-            result_file = task_dir / "_result.md"
-            if result_file.exists():
-                result = result_file.read_text()
+            result = await run_io(_read_if_exists, task_dir / "_result.md")
+            if result is not None:
                 await self._promote_to_published(task_dir)
                 self.node.status = "completed"
                 self.node.result = result
                 self.worker.status = "idle"
                 return result
 
-            # No result file — check stdout
-            stdout = (await proc.stdout.read()).decode() if proc.stdout else ""
+            # No result file — report the tail of the output
+            await asyncio.wait(drains, timeout=1)  # pick up whatever was still buffered in the pipes
+            stdout = b"".join(stdout_tail).decode(errors="replace")
+            stderr = b"".join(stderr_tail).decode(errors="replace")
             self.node.status = "failed"
-            self.node.result = f"Autonomous worker exited without _result.md.\nStdout: {stdout[:1000]}"
+            self.node.result = f"Autonomous worker exited without _result.md.\nStdout: {stdout[-1000:]}"
+            if stderr.strip():
+                self.node.result += f"\nStderr: {stderr[-1000:]}"
             self.worker.status = "idle"
             return self.node.result
 
@@ -562,6 +703,22 @@ class AutonomousWorkerExecutor:
             self.node.result = f"Autonomous worker error: {e}"
             self.worker.status = "idle"
             return self.node.result
+        finally:
+            for task in drains:
+                task.cancel()
+
+    async def _wait_for_activity(self, exited: asyncio.Future):
+        """Sleep up to POLL_INTERVAL, returning early if the process exits or a message arrives."""
+        waiters = {exited}
+        message = None
+        if self.context.message_bus:
+            message = asyncio.ensure_future(self.context.message_bus.wait(self.worker.name))
+            waiters.add(message)
+        try:
+            await asyncio.wait(waiters, timeout=self.POLL_INTERVAL, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if message is not None:
+                message.cancel()
 
     def _build_command(self, task_dir: Path) -> list[str]:
         """Build the command to launch the external agent."""
@@ -574,50 +731,90 @@ class AutonomousWorkerExecutor:
             "--output-dir", str(task_dir),
         ]
 
-    def _bridge_messages(self, task_dir: Path):
+    async def _bridge_messages(self, task_dir: Path):
         """Bridge messages between message bus and file-based inbox/outbox."""
         # Deliver inbox
         if self.context.message_bus:
             messages = self.context.message_bus.receive(self.worker.name)
             if messages:
-                inbox = task_dir / "_inbox.md"
-                with open(inbox, "a") as f:
-                    for msg in messages:
-                        f.write(f"FROM: {msg.from_id}\n{msg.content}\n---\n")
-
-        # Read outbox
-        outbox = task_dir / "_outbox.md"
-        if outbox.exists():
-            content = outbox.read_text()
-            if content.strip():
-                for block in content.split("---"):
-                    block = block.strip()
-                    if not block:
-                        continue
-                    lines = block.split("\n")
-                    to = "coordinator"
-                    msg_content = block
-                    for line in lines:
-                        if line.startswith("TO:"):
-                            to = line[3:].strip()
-                            msg_content = "\n".join(l for l in lines if not l.startswith("TO:"))
-                            break
-                    if self.context.message_bus:
-                        self.context.message_bus.send(self.worker.name, to, msg_content)
-                # Clear outbox
-                outbox.write_text("")
+                text = "".join(f"FROM: {msg.from_id}\n{msg.content}\n---\n" for msg in messages)
+                await run_io(write_text, task_dir / "_inbox.md", text, "a")
+
+        # Read (and clear) outbox
+        content = await run_io(_take_outbox, task_dir / "_outbox.md")
+        if content and content.strip():
+            for block in _OUTBOX_SEP_RE.split(content):
+                block = block.strip()
+                if not block:
+                    continue
+                to = "coordinator"
+                msg_content = block
+                m = _OUTBOX_TO_RE.search(block)
+                if m:
+                    to = m.group(1).strip()
+                    msg_content = _OUTBOX_TO_RE.sub("", block)
+                if self.context.message_bus:
+                    self.context.message_bus.send(self.worker.name, to, msg_content)
 
     async def _promote_to_published(self, task_dir: Path):
         """Move relevant files from scratch to published."""
         if not self.node.data_dir:
             return
-        published = self.node.data_dir / "published"
-        published.mkdir(parents=True, exist_ok=True)
-        for f in task_dir.iterdir():
-            if f.name.startswith("_"):
-                continue  # skip metadata files
-            dest = published / f.name
-            if f.is_dir():
-                shutil.copytree(f, dest, dirs_exist_ok=True)
-            else:
-                shutil.copy2(f, dest)
+        await run_io(_promote_tree, task_dir, self.node.data_dir / "published")
+
+
+def _append_bytes(path: Path, data: bytes):
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+def _prepare_task_dir(task_dir: Path, task: str, refs: dict[str, str]):
+    task_dir.mkdir(parents=True, exist_ok=True)
+    (task_dir / "_task.md").write_text(task)
+    if refs:
+        (task_dir / "_context.json").write_bytes(dumps(refs))
+    (task_dir / "_inbox.md").write_text("")
+    (task_dir / "_outbox.md").write_text("")
+
+
+def _read_if_exists(path: Path) -> str | None:
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def _take_outbox(outbox: Path) -> str | None:
+    """Read and clear the outbox; a stat is enough to skip the common empty case."""
+    try:
+        if outbox.stat().st_size == 0:
+            return None
+    except FileNotFoundError:
+        return None
+    content = outbox.read_text()
+    outbox.write_text("")
+    return content
+
+
+def _promote_tree(task_dir: Path, published: Path):
+    published.mkdir(parents=True, exist_ok=True)
+    for f in task_dir.iterdir():
+        if f.name.startswith("_"):
+            continue  # skip metadata files
+        _promote_entry(f, published / f.name)
+
+
+def _promote_entry(src: Path, dest: Path):
+    """Move src to dest — a metadata-only rename when both are on one filesystem.
+
+    Existing destination directories are merged into; anything rename can't
+    handle (e.g. a cross-device move) falls back to a copy.
+    """
+    if dest.is_dir() and src.is_dir():
+        for child in src.iterdir():
+            _promote_entry(child, dest / child.name)
+        return
+    try:
+        os.replace(src, dest)
+    except OSError:
+        copy_entry(src, dest)
@@ -169,7 +169,8 @@ export function useAgent(agentId: string) {
             event.type.startsWith("node.") ||
             event.type.startsWith("worker.") ||
             event.type.startsWith("agent.") ||
-            event.type === "message.sent"
+            event.type === "message.sent" ||
+            event.type === "events.overflow"
           ) {
             needsRefresh = true;
           }
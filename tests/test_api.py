@@ -122,3 +122,33 @@ def test_delete_agent():
     assert resp.status_code == 200
     # Should be gone
     assert client.get(f"/agents/{agent_id}").status_code == 404
+
+
+def test_conversation_etag_not_modified():
+    agent = Agent(goal="Test")
+    agent_registry[agent.id] = agent
+    resp = client.get(f"/agents/{agent.id}/conversation")
+    etag = resp.headers["etag"]
+
+    resp = client.get(f"/agents/{agent.id}/conversation", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+    agent.log_conversation("human", "hello")
+    resp = client.get(f"/agents/{agent.id}/conversation", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()[-1]["content"] == "hello"
+
+
+def test_workspace_listing_streams_entries():
+    agent = Agent(goal="Test")
+    agent_registry[agent.id] = agent
+    (agent.current_run_dir / "notes.md").write_text("hello")
+
+    resp = client.get(f"/agents/{agent.id}/workspace")
+    assert resp.status_code == 200
+    entries = {e["name"]: e for e in resp.json()["entries"]}
+    assert entries["notes.md"] == {"name": "notes.md", "type": "file", "size": 5}
+    assert entries["nodes"]["type"] == "dir"
+
+    resp = client.get(f"/agents/{agent.id}/workspace", headers={"If-None-Match": resp.headers["etag"]})
+    assert resp.status_code == 304
@@ -1,6 +1,8 @@
 """Test EventBus."""
 
-from agiraph.events import EventBus
+import json
+
+from agiraph.events import EventBus, preview_args
 from agiraph.models import Event
 
 
@@ -31,3 +33,53 @@ def test_recent_pagination():
 
     assert len(bus.recent(limit=3)) == 3
     assert len(bus.recent(limit=100)) == 10
+
+
+def test_recent_offset_and_bounded_history():
+    bus = EventBus(max_history=5)
+    for i in range(10):
+        bus.emit_simple("event", "a1", i=i)
+
+    assert [e.data["i"] for e in bus.recent(limit=100)] == [5, 6, 7, 8, 9]
+    assert [e.data["i"] for e in bus.recent(limit=2, offset=1)] == [7, 8]
+    assert bus.recent(limit=2, offset=50) == []
+
+
+def test_slow_subscriber_drops_oldest():
+    bus = EventBus()
+    q = bus.subscribe(maxsize=4)
+    for i in range(10):
+        bus.emit_simple("event", "a1", i=i)
+
+    drained = [q.get_nowait() for _ in range(q.qsize())]
+    assert [e.type for e in drained].count("events.overflow") == 1
+    assert [e.data["i"] for e in drained if e.type == "event"][-1] == 9
+
+
+def test_overflow_marker_stays_ahead_of_later_events():
+    bus = EventBus()
+    q = bus.subscribe(maxsize=4)
+    for i in range(20):
+        bus.emit_simple("event", "a1", i=i)
+
+    drained = [q.get_nowait() for _ in range(q.qsize())]
+    assert drained[0].type == "events.overflow"
+    assert [e.data["i"] for e in drained[1:]] == [17, 18, 19]
+    assert len(drained) == 4
+
+
+def test_persist_jsonl(tmp_path):
+    log = tmp_path / "events.jsonl"
+    bus = EventBus(log_file=log)
+    bus.emit_simple("node.created", "a1", node_id="n1", path=tmp_path / "x")
+
+    record = json.loads(log.read_text().splitlines()[0])
+    assert record["type"] == "node.created"
+    assert record["data"]["path"] == str(tmp_path / "x")
+
+
+def test_preview_args_bounds_values():
+    preview = preview_args({"path": "x" * 500, "items": list(range(1000)), "n": 3})
+    assert preview["path"] == "x" * 100
+    assert preview["items"] == "[0, 1, 2, 3, 4, ...]"
+    assert preview["n"] == "3"
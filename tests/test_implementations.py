@@ -0,0 +1,146 @@
+"""Test tool implementations against a temporary agent home (no LLM calls)."""
+
+import asyncio
+import json
+import time
+
+from agiraph.message_bus import MessageBus
+from agiraph.models import WorkNode, Worker
+from agiraph.tools import implementations
+from agiraph.tools.context import ToolContext
+from agiraph.tools.implementations import (
+    flush_worker_memory, impl_ask_human, impl_bash, impl_list_files, impl_memory_search, impl_publish,
+    impl_read_file, impl_read_ref,
+)
+
+
+def _context(tmp_path, **kwargs) -> ToolContext:
+    agent_path = tmp_path / "agent"
+    run_dir = agent_path / "runs" / "run1"
+    run_dir.mkdir(parents=True)
+    return ToolContext(agent_id="a1", agent_path=agent_path, run_dir=run_dir, **kwargs)
+
+
+async def test_publish_copies_scratch(tmp_path):
+    ctx = _context(tmp_path)
+    node = WorkNode(task="t", data_dir=ctx.run_dir / "nodes" / "n1")
+    (node.data_dir / "scratch" / "sub").mkdir(parents=True)
+    (node.data_dir / "scratch" / "report.md").write_text("# Report")
+    (node.data_dir / "scratch" / "sub" / "data.txt").write_text("x")
+    worker = Worker(name="w1", worker_dir=ctx.run_dir / "workers" / "w1")
+    ctx.node, ctx.worker = node, worker
+
+    result = await impl_publish(ctx, summary="done")
+
+    published = node.data_dir / "published"
+    assert (published / "report.md").read_text() == "# Report"
+    assert (published / "sub" / "data.txt").read_text() == "x"
+    assert node.status == "completed"
+    await flush_worker_memory()
+    assert "done" in (worker.worker_dir / "memory.md").read_text()
+    assert "report.md" in result
+
+
+async def test_overlapping_memory_flushes_keep_order(tmp_path, monkeypatch):
+    mem_file = tmp_path / "w1" / "memory.md"
+    write = implementations.write_text
+
+    def slow_first_write(path, text, mode="w"):
+        if "first" in text:
+            time.sleep(0.1)
+        write(path, text, mode)
+
+    monkeypatch.setattr(implementations, "write_text", slow_first_write)
+    implementations._MEM_BUF[mem_file].append("first\n")
+    earlier = asyncio.create_task(flush_worker_memory(mem_file))
+    await asyncio.sleep(0.01)
+    implementations._MEM_BUF[mem_file].append("second\n")
+    await flush_worker_memory(mem_file)
+    await earlier
+    assert mem_file.read_text() == "first\nsecond\n"
+
+
+async def test_memory_search_returns_matching_sections(tmp_path, monkeypatch):
+    ctx = _context(tmp_path)
+    (ctx.memory_dir / "knowledge").mkdir(parents=True)
+    (ctx.memory_dir / "knowledge" / "notes.md").write_text(
+        "intro\n## Python\nasyncio tips\n### Rust\nownership\n## Go\ngoroutines"
+    )
+    monkeypatch.setattr(implementations, "MAX_MEMORY_INLINE", 0)
+
+    result = await impl_memory_search(ctx, query="ASYNCIO goroutines")
+    assert "## Python\nasyncio tips" in result
+    assert "## Go\ngoroutines" in result
+    assert "ownership" not in result
+    assert await impl_memory_search(ctx, query="haskell") == "No matching memory found."
+
+
+async def test_memory_search_sees_new_files(tmp_path):
+    ctx = _context(tmp_path)
+    (ctx.memory_dir / "knowledge").mkdir(parents=True)
+    (ctx.memory_dir / "index.md").write_text("# Index")
+    assert "Index" in await impl_memory_search(ctx, query="index")
+
+    await implementations.impl_memory_write(ctx, path="knowledge/topic.md", content="## Topic\nnew fact")
+    assert "new fact" in await impl_memory_search(ctx, query="fact")
+
+    # Written outside memory_write (write_file, bash, other workers) and into a subdirectory
+    (ctx.memory_dir / "knowledge" / "other.md").write_text("## Other\nside channel")
+    assert "side channel" in await impl_memory_search(ctx, query="channel")
+
+
+async def test_ask_human_times_out(tmp_path):
+    ctx = _context(tmp_path, message_bus=MessageBus(), human_timeout=0.01)
+    result = await impl_ask_human(ctx, question="Proceed?")
+    assert "did not respond" in result
+
+
+async def test_read_ref_follows_refs_file(tmp_path):
+    ctx = _context(tmp_path)
+    ctx.node = WorkNode(task="t", data_dir=ctx.run_dir / "nodes" / "n2")
+    ctx.node.data_dir.mkdir(parents=True)
+    (ctx.run_dir / "a.md").write_text("alpha")
+    (ctx.run_dir / "b.md").write_text("beta")
+    refs_file = ctx.node.data_dir / "_refs.json"
+
+    refs_file.write_text(json.dumps({"src": "a.md"}))
+    assert await impl_read_ref(ctx, "src") == "alpha"
+
+    refs_file.write_text(json.dumps({"src": "b.md", "extra": "a.md"}))
+    assert await impl_read_ref(ctx, "src") == "beta"
+    assert "Available" in await impl_read_ref(ctx, "missing")
+
+
+async def test_read_file_truncates_large_files(tmp_path):
+    ctx = _context(tmp_path)
+    (ctx.run_dir / "big.txt").write_text("x" * 60_000)
+    (ctx.run_dir / "small.txt").write_text("hello")
+
+    content = await impl_read_file(ctx, "big.txt")
+    assert content.endswith("[... truncated ...]")
+    assert content.count("x") == 50_000
+    assert await impl_read_file(ctx, "small.txt") == "hello"
+
+
+async def test_list_files_sorted_with_type_markers(tmp_path):
+    ctx = _context(tmp_path)
+    (ctx.run_dir / "b.txt").write_text("b")
+    (ctx.run_dir / "a_dir").mkdir()
+    (ctx.run_dir / "empty").mkdir()
+
+    assert await impl_list_files(ctx, ".") == "📁 a_dir\n📄 b.txt\n📁 empty"
+    assert await impl_list_files(ctx, "empty") == "(empty directory)"
+
+
+async def test_bash_bounds_output(tmp_path):
+    ctx = _context(tmp_path)
+    out = await impl_bash(ctx, "yes x | head -c 1000000; echo done >&2")
+    assert out.endswith("[... truncated ...]")
+    assert len(out) < 10_100
+    assert await impl_bash(ctx, "sleep 5", timeout=0.2) == "Command timed out after 0.2s"
+
+
+async def test_bash_truncates_multibyte_output_by_chars(tmp_path):
+    ctx = _context(tmp_path)
+    out = await impl_bash(ctx, "python3 -c \"print('é' * 20000)\"")
+    assert out == "é" * 10_000 + "\n\n[... truncated ...]"
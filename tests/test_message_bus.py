@@ -1,5 +1,7 @@
 """Test MessageBus."""
 
+import asyncio
+
 from agiraph.message_bus import MessageBus
 
 
@@ -50,3 +52,16 @@ def test_has_messages():
     assert not bus.has_messages("alice")
     bus.send("bob", "alice", "hey")
     assert bus.has_messages("alice")
+
+
+async def test_wait_wakes_on_send():
+    bus = MessageBus()
+    bus.register("w1")
+
+    assert await bus.wait("w1", timeout=0.01) is False
+
+    waiter = asyncio.ensure_future(bus.wait("w1", timeout=5))
+    await asyncio.sleep(0)
+    bus.send("coordinator", "w1", "ping")
+    assert await asyncio.wait_for(waiter, 1) is True
+    assert bus.receive("w1")[0].content == "ping"
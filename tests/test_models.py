@@ -2,7 +2,7 @@
 
 from agiraph.models import (
     WorkNode, WorkBoard, Worker, WorkerPool, Message, Event,
-    ToolDef, ToolCall, Stage, StageContract, generate_id,
+    ToolDef, ToolCall, Stage, StageContract, Trigger, TriggerStore, generate_id,
 )
 
 
@@ -88,3 +88,17 @@ def test_event():
     d = event.to_dict()
     assert d["type"] == "node.created"
     assert d["data"]["node_id"] == "n1"
+
+
+def test_trigger_store():
+    store = TriggerStore()
+    t1, t2 = Trigger(id="t1"), Trigger(id="t2")
+    store.add(t1)
+    store.add(t2)
+    assert [t.id for t in store.active()] == ["t1", "t2"]
+
+    assert store.cancel("t1") is t1
+    assert t1.status == "expired"
+    assert [t.id for t in store.active()] == ["t2"]
+    assert store.cancel("missing") is None
+    assert len(store) == 2
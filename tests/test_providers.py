@@ -59,3 +59,34 @@ def test_tool_prompt_generation():
     prompt = adapter.format_tool_prompt(tools)
     assert "bash" in prompt
     assert "Use carefully" in prompt
+
+
+def test_prepare_tools_memoized_on_identity():
+    adapter = AnthropicAdapter()
+    tools = (ToolDef(name="bash", description="Run", parameters={}, guidance="Use carefully"),)
+
+    payload = adapter.prepare_tools(tools)
+    assert adapter.prepare_tools(tools) is payload
+    assert [t["name"] for t in payload] == ["bash", "web_search"]
+    assert adapter.prepare_tool_prompt(tools) is adapter.prepare_tool_prompt(tools)
+
+    other = (ToolDef(name="read_file", description="Read", parameters={}),)
+    assert [t["name"] for t in adapter.prepare_tools(other)] == ["read_file", "web_search"]
+
+
+def test_anthropic_formats_history_incrementally():
+    adapter = AnthropicAdapter()
+    conversation = [{"role": "user", "content": "task"}]
+
+    first = adapter._format_messages(conversation)
+    assert first[-1]["content"] == [{"type": "text", "text": "task", "cache_control": {"type": "ephemeral"}}]
+
+    conversation.append({"role": "assistant", "content": "", "tool_calls": [{"id": "t1", "name": "bash", "args": {}}]})
+    conversation.append({"role": "tool", "tool_use_id": "t1", "content": "ok"})
+    second = adapter._format_messages(conversation)
+    assert second[0] == {"role": "user", "content": "task"}  # breakpoint moved, cached entry untouched
+    assert second[1]["content"][0]["type"] == "tool_use"
+    assert second[2]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+    # A replaced conversation is formatted from scratch
+    assert adapter._format_messages([{"role": "user", "content": "other"}])[0]["content"][0]["text"] == "other"
@@ -26,3 +26,14 @@ def test_resolve_path_prevents_traversal(tmp_path):
     ctx = ToolContext(agent_path=agent_path, run_dir=run_dir)
     with pytest.raises(PermissionError):
         ctx.resolve_path("../../../../etc/passwd")
+
+
+def test_resolve_path_rejects_sibling_prefix(tmp_path):
+    agent_path = tmp_path / "agents" / "test"
+    run_dir = agent_path / "runs" / "run1"
+    run_dir.mkdir(parents=True)
+    (tmp_path / "agents" / "test2").mkdir()
+
+    ctx = ToolContext(agent_path=agent_path, run_dir=run_dir)
+    with pytest.raises(PermissionError):
+        ctx.resolve_path("../../../test2/secret.md")
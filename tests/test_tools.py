@@ -3,7 +3,7 @@
 from agiraph.tools.definitions import ALL_TOOLS, WORKER_TOOLS, COORDINATOR_TOOLS
 from agiraph.tools.registry import ToolRegistry
 from agiraph.tools.setup import create_default_registry
-from agiraph.models import ToolCall
+from agiraph.models import ToolCall, ToolDef
 
 
 def test_all_tools_defined():
@@ -49,3 +49,30 @@ def test_tool_parameters_valid():
     for tool in ALL_TOOLS:
         assert tool.parameters.get("type") == "object"
         assert "properties" in tool.parameters
+
+
+async def test_registry_dispatch_sync_and_async():
+    registry = ToolRegistry()
+
+    async def async_impl(context, x):
+        return f"async {x}"
+
+    def sync_impl(context, x):
+        return x * 2
+
+    registry.register(ToolDef(name="a", description="", parameters={}), async_impl)
+    registry.register(ToolDef(name="s", description="", parameters={}), sync_impl)
+
+    assert await registry.dispatch(ToolCall(name="a", args={"x": 1}), None) == "async 1"
+    assert await registry.dispatch(ToolCall(name="s", args={"x": 2}), None) == "4"
+    assert "Unknown tool" in await registry.dispatch(ToolCall(name="nope", args={}), None)
+
+
+def test_registry_tool_lists_cached_until_register():
+    registry = create_default_registry()
+    worker_tools = registry.get_worker_tools()
+    assert registry.get_worker_tools() is worker_tools
+
+    registry.register(ToolDef(name="extra", description="", parameters={}), lambda context: "")
+    assert registry.get_worker_tools() is not worker_tools
+    assert "extra" in {t.name for t in registry.get_worker_tools()}
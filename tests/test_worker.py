@@ -0,0 +1,66 @@
+"""Test WorkerExecutor helpers (no LLM calls)."""
+
+import asyncio
+
+from agiraph import worker as worker_module
+from agiraph.models import ToolCall, WorkNode, Worker
+from agiraph.tools.context import ToolContext
+from agiraph.tools.setup import create_default_registry
+from agiraph.worker import WorkerExecutor
+
+
+def _executor(tmp_path) -> WorkerExecutor:
+    run_dir = tmp_path / "runs" / "run1"
+    run_dir.mkdir(parents=True)
+    context = ToolContext(agent_id="a1", agent_path=tmp_path, run_dir=run_dir)
+    node = WorkNode(task="t", data_dir=run_dir / "nodes" / "n1")
+    return WorkerExecutor(Worker(name="w1"), node, create_default_registry(), context)
+
+
+async def test_idempotent_tool_results_cached_until_a_write(tmp_path):
+    executor = _executor(tmp_path)
+    (executor.context.run_dir / "notes.md").write_text("v1")
+    read = ToolCall(name="read_file", args={"path": "notes.md"})
+
+    assert await executor._dispatch(read) == "v1"
+    (executor.context.run_dir / "notes.md").write_text("changed out of band")
+    assert await executor._dispatch(read) == "v1"  # served from cache
+
+    await executor._dispatch(ToolCall(name="write_file", args={"path": "notes.md", "content": "v2"}))
+    assert await executor._dispatch(read) == "v2"
+
+
+async def test_cancel_marks_node_stopped(tmp_path):
+    executor = _executor(tmp_path)
+
+    async def hang(**kwargs):
+        await asyncio.sleep(60)
+
+    executor.provider.generate = hang
+    task = asyncio.ensure_future(executor.execute())
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    assert await task == "Stopped by user"
+    assert executor.node.status == "failed"
+    assert executor.worker.status == "idle"
+    assert "Stopped by user" in (executor.node.data_dir / "failure_notes.md").read_text()
+
+
+async def test_conversation_trimmed_to_window(tmp_path, monkeypatch):
+    monkeypatch.setattr(worker_module, "CONVERSATION_WINDOW", 4)
+    executor = _executor(tmp_path)
+    executor.node.data_dir.mkdir(parents=True)
+    executor.conversation = [{"role": "user", "content": "spec"}]
+    for i in range(6):
+        executor.conversation.append({"role": "assistant", "content": "", "tool_calls": [{"id": f"t{i}", "name": "x", "args": {}}]})
+        executor.conversation.append({"role": "tool", "tool_use_id": f"t{i}", "content": f"r{i}"})
+
+    await executor._trim_conversation()
+
+    conv = executor.conversation
+    assert conv[0]["content"] == "spec"
+    assert "8 earlier messages" in conv[1]["content"]
+    assert conv[2]["role"] == "assistant" and len(conv) == 6
+    archive = (executor.node.data_dir / "conversation_archive.jsonl").read_text().splitlines()
+    assert len(archive) == 8
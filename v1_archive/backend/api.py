@@ -2,6 +2,7 @@
 import asyncio
 import json
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -11,12 +12,21 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from .planner import Planner
-from .executor import DAGExecutor
+from .executor import DAGExecutor, enable_console_log
 from .config import Config
 from .models import Plan, NodeStatus
+from .providers.factory import close_providers
 
 
-app = FastAPI(title="AI Agent Orchestration Framework")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the pooled provider connections on shutdown
+    await close_providers()
+
+
+app = FastAPI(title="AI Agent Orchestration Framework", lifespan=lifespan)
+enable_console_log()
 
 # Add CORS middleware
 app.add_middleware(
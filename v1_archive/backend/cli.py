@@ -1,14 +1,20 @@
 """Command-line interface for the AI orchestration framework."""
+import argparse
 import asyncio
+import hashlib
+import os
+import uuid
 from datetime import datetime
 from pathlib import Path
-from rich.console import Console
+from typing import Optional
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from .planner import Planner
-from .executor import DAGExecutor
+from .executor import DAGExecutor, enable_console_log
 from .config import Config
+from .models import Plan
 
 
 console = Console()
@@ -16,20 +22,75 @@ console = Console()
 # Prompt log file
 PROMPT_LOG_FILE = Path(__file__).parent.parent / "prompts.log"
 
+# Plans from earlier sessions, keyed by sha256(prompt, planner provider, model)
+PLAN_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "plans"
+
+# Status cell markup, built once instead of per row
+_STATUS_STYLE = {
+    "pending": "dim",
+    "ready": "yellow",
+    "running": "blue",
+    "completed": "green",
+    "failed": "red"
+}
+_STATUS_MARKUP = {status: f"[{style}]{status}[/{style}]" for status, style in _STATUS_STYLE.items()}
+
+# O_APPEND fd opened on first use and kept for the whole session: each entry is
+# a single unbuffered write(), appended atomically, with no per-prompt open/close
+_prompt_log_fd = None
+
 
 def log_prompt(model: str, prompt: str):
     """Log user prompt to file."""
+    global _prompt_log_fd
     try:
         timestamp = datetime.now().isoformat()
-        log_entry = f"{timestamp}|{model}|{prompt}\n"
+        log_entry = f"{timestamp}|{model}|{prompt}\n".encode("utf-8")
         
-        with open(PROMPT_LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(log_entry)
+        if _prompt_log_fd is None:
+            _prompt_log_fd = os.open(PROMPT_LOG_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        os.write(_prompt_log_fd, log_entry)
     except Exception as e:
         # Don't fail if logging fails
         console.print(f"[dim red]Warning: Failed to log prompt: {e}[/dim red]")
 
 
+def close_prompt_log():
+    """Close the prompt log fd (called when the CLI exits)."""
+    global _prompt_log_fd
+    if _prompt_log_fd is not None:
+        os.close(_prompt_log_fd)
+        _prompt_log_fd = None
+
+
+def _plan_cache_path(user_prompt: str, provider: str, model: str) -> Path:
+    """Content-addressed location of the cached plan for this prompt and planner."""
+    key = hashlib.sha256("\x00".join((user_prompt, provider, model)).encode("utf-8")).hexdigest()
+    return PLAN_CACHE_DIR / f"{key}.json"
+
+
+def load_cached_plan(path: Path) -> Optional[Plan]:
+    """Load a previously saved plan, or None if missing or unreadable."""
+    try:
+        plan = Plan.model_validate_json(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    plan.plan_id = str(uuid.uuid4())  # each run of the plan gets its own id
+    return plan
+
+
+def save_cached_plan(path: Path, plan: Plan):
+    """Save a freshly created (not yet executed) plan for later sessions."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(plan.model_dump_json().encode("utf-8"))
+        tmp.replace(path)
+    except OSError as e:
+        # Don't fail if caching fails
+        console.print(f"[dim red]Warning: Failed to cache plan: {e}[/dim red]")
+
+
 def select_from_list(items: list, prompt_text: str, default_index: int = 0, item_formatter=None) -> str:
     """Display numbered list and allow selection by number or name.
     
@@ -56,24 +117,23 @@ def select_from_list(items: list, prompt_text: str, default_index: int = 0, item
         console.print(f"  {marker} [{i}] {display_text}")
     
     # Get user input
+    count = len(items)
     while True:
-        choice = Prompt.ask(f"\nEnter choice [1-{len(items)}] or name", default=str(default_index + 1))
+        choice = Prompt.ask(f"\nEnter choice [1-{count}] or name", default=str(default_index + 1))
         
-        # Try to parse as number
-        try:
-            choice_num = int(choice)
-            if 1 <= choice_num <= len(items):
+        # Number? (isdecimal rather than int() in a try: no exception on every name entry)
+        number = choice.strip()
+        if number.isdecimal():
+            choice_num = int(number)
+            if 1 <= choice_num <= count:
                 return items[choice_num - 1]
-            else:
-                console.print(f"[red]Invalid number. Please enter 1-{len(items)}[/red]")
-                continue
-        except ValueError:
-            # Not a number, try to match by name
-            if choice in items:
-                return choice
-            else:
-                console.print(f"[red]Invalid choice. Please enter a number (1-{len(items)}) or provider name[/red]")
-                continue
+            console.print(f"[red]Invalid number. Please enter 1-{count}[/red]")
+            continue
+        
+        # Not a number, try to match by name
+        if choice in items:
+            return choice
+        console.print(f"[red]Invalid choice. Please enter a number (1-{count}) or provider name[/red]")
 
 
 def print_dag(plan):
@@ -110,6 +170,8 @@ def print_node_details(plan):
     """Print detailed information about each node."""
     console.print("\n[bold cyan]Node Details:[/bold cyan]")
     
+    # Build every panel first and render them in one print call
+    panels = []
     for node in plan.nodes:
         input_info = node.input_description if node.input_description else "No inputs needed"
         output_info = node.output_description if node.output_description else "See description"
@@ -121,7 +183,8 @@ def print_node_details(plan):
 
 [bold]Outputs Produced:[/bold] {output_info}
 """
-        console.print(Panel(panel_content, title=f"[bold]{node.id}: {node.name}[/bold]", border_style="blue"))
+        panels.append(Panel(panel_content, title=f"[bold]{node.id}: {node.name}[/bold]", border_style="blue"))
+    console.print(Group(*panels))
 
 
 def print_execution_status(plan):
@@ -134,24 +197,13 @@ def print_execution_status(plan):
     table.add_column("Time", style="yellow")
     table.add_column("Error", style="red")
     
+    add_row = table.add_row
     for node in plan.nodes:
-        status_style = {
-            "pending": "dim",
-            "ready": "yellow",
-            "running": "blue",
-            "completed": "green",
-            "failed": "red"
-        }.get(node.status, "white")
-        
+        status_cell = _STATUS_MARKUP.get(node.status) or f"[white]{node.status}[/white]"
         time_str = f"{node.execution_time:.2f}s" if node.execution_time else "-"
-        error_str = node.error[:50] + "..." if node.error and len(node.error) > 50 else (node.error or "-")
-        
-        table.add_row(
-            node.id,
-            f"[{status_style}]{node.status}[/{status_style}]",
-            time_str,
-            error_str
-        )
+        error = node.error
+        error_str = error[:50] + "..." if error and len(error) > 50 else (error or "-")
+        add_row(node.id, status_cell, time_str, error_str)
     
     console.print(table)
 
@@ -160,14 +212,27 @@ def print_results(execution_result):
     """Print execution results."""
     console.print("\n[bold green]Execution Results:[/bold green]")
     
+    panels = []
     for node_id, result in execution_result.get("node_results", {}).items():
         # Result is now natural language, not JSON
         result_text = result if isinstance(result, str) else str(result)
-        console.print(Panel(result_text, title=f"[bold]Node {node_id} Result[/bold]", border_style="green"))
+        panels.append(Panel(result_text, title=f"[bold]Node {node_id} Result[/bold]", border_style="green"))
+    console.print(Group(*panels))
+
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse CLI flags."""
+    parser = argparse.ArgumentParser(description="AI Agent Orchestration Framework")
+    parser.add_argument(
+        "--cache", action=argparse.BooleanOptionalAction, default=True,
+        help="reuse plans created for an identical prompt and planner model (default: on)"
+    )
+    return parser.parse_args(argv)
 
-async def main():
+
+async def main(use_plan_cache: bool = True):
     """Main CLI loop."""
+    enable_console_log()
     console.print("[bold magenta]AI Agent Orchestration Framework[/bold magenta]")
     console.print("=" * 60)
     
@@ -218,11 +283,18 @@ async def main():
             # Create plan - force all nodes to use the same provider/model
             console.print("\n[bold yellow]Creating execution plan...[/bold yellow]")
             console.print(f"[dim]All nodes will use: {planner_provider} / {default_model}[/dim]")
-            plan = await planner.create_plan(
-                user_prompt,
-                force_provider=planner_provider,
-                force_model=default_model
-            )
+            cache_path = _plan_cache_path(user_prompt, planner_provider, default_model)
+            plan = load_cached_plan(cache_path) if use_plan_cache else None
+            if plan is not None:
+                console.print("[dim]Reusing cached plan for this prompt (run with --no-cache to re-plan)[/dim]")
+            else:
+                plan = await planner.create_plan(
+                    user_prompt,
+                    force_provider=planner_provider,
+                    force_model=default_model
+                )
+                if use_plan_cache:
+                    save_cached_plan(cache_path, plan)
             
             # Display plan
             print_dag(plan)
@@ -264,4 +336,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    try:
+        asyncio.run(main(use_plan_cache=args.cache))
+    finally:
+        close_prompt_log()
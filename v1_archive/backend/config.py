@@ -1,32 +1,93 @@
 """Configuration management for API keys and settings."""
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
-# Load .env file from project root (if it exists and is readable)
 env_path = Path(__file__).parent.parent / '.env'
-try:
-    if env_path.exists() and env_path.is_file():
-        load_dotenv(dotenv_path=env_path)
-    else:
-        # Try loading from current directory or environment
-        load_dotenv()
-except (PermissionError, OSError):
-    # If we can't read .env, just use environment variables
-    pass
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load the .env file once, the first time a setting is read (not at import)."""
+    # Load .env file from project root (if it exists and is readable)
+    try:
+        if env_path.exists() and env_path.is_file():
+            load_dotenv(dotenv_path=env_path)
+        else:
+            # Try loading from current directory or environment
+            load_dotenv()
+    except (PermissionError, OSError):
+        # If we can't read .env, just use environment variables
+        pass
+
+
+class _EnvSetting:
+    """Config class attribute computed from the environment on first access.
+    
+    The first read loads .env, evaluates `read()` and replaces the descriptor with
+    the plain value, so later reads are ordinary attribute loads.
+    """
+    
+    def __init__(self, read):
+        self._read = read
+    
+    def __set_name__(self, owner, name):
+        self._name = name
+    
+    def __get__(self, obj, owner=None):
+        load_env()
+        value = self._read()
+        setattr(owner, self._name, value)
+        return value
+
+
+def _env(name: str, default: Optional[str] = None) -> _EnvSetting:
+    return _EnvSetting(lambda: os.getenv(name, default))
 
 
 class Config:
     """Application configuration."""
     
+    # Environment-backed settings are read lazily (see _EnvSetting): importing
+    # this module does no filesystem access.
+    
     # API Keys
-    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    ANTHROPIC_API_KEY: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
-    GOOGLE_API_KEY: Optional[str] = os.getenv("GOOGLE_API_KEY")
-    MINIMAX_API_KEY: Optional[str] = os.getenv("MINIMAX_API_KEY")
-    MINIMAX_GROUP_ID: Optional[str] = os.getenv("MINIMAX_GROUP_ID")
-    OPENROUTER_API_KEY: Optional[str] = os.getenv("OPENROUTER_API_KEY")
+    OPENAI_API_KEY: Optional[str] = _env("OPENAI_API_KEY")
+    ANTHROPIC_API_KEY: Optional[str] = _env("ANTHROPIC_API_KEY")
+    GOOGLE_API_KEY: Optional[str] = _env("GOOGLE_API_KEY")
+    MINIMAX_API_KEY: Optional[str] = _env("MINIMAX_API_KEY")
+    MINIMAX_GROUP_ID: Optional[str] = _env("MINIMAX_GROUP_ID")
+    OPENROUTER_API_KEY: Optional[str] = _env("OPENROUTER_API_KEY")
+
+    # Reuse responses for byte-identical node prompts within a process (set LLM_CACHE=0 to disable)
+    LLM_CACHE_ENABLED: bool = _EnvSetting(lambda: os.getenv("LLM_CACHE", "1") != "0")
+
+    # Opt-in: answer "combine/merge the inputs" nodes by concatenating dependency results
+    # instead of calling the LLM (set DIRECT_NODES=1 to enable)
+    DIRECT_NODES_ENABLED: bool = _EnvSetting(lambda: os.getenv("DIRECT_NODES", "0") == "1")
+
+    # Max concurrent LLM calls per shared provider instance (process-wide).
+    # MAX_CONCURRENT_PER_PROVIDER sets the default; <PROVIDER>_MAX_CONCURRENT overrides one provider.
+    MAX_CONCURRENT_PER_PROVIDER: Dict[str, int] = _EnvSetting(lambda: {
+        name: int(os.getenv(f"{name.upper()}_MAX_CONCURRENT", os.getenv("MAX_CONCURRENT_PER_PROVIDER", "10")))
+        for name in ("openai", "anthropic", "gemini", "minimax", "openrouter")
+    })
+
+    # Client-side rate limits per provider: <PROVIDER>_RPM requests and <PROVIDER>_TPM
+    # (estimated) tokens per minute; unset or 0 means unlimited
+    RATE_LIMITS: Dict[str, Tuple[int, int]] = _EnvSetting(lambda: {
+        name: (int(os.getenv(f"{name.upper()}_RPM", "0")), int(os.getenv(f"{name.upper()}_TPM", "0")))
+        for name in ("openai", "anthropic", "gemini", "minimax", "openrouter")
+    })
+
+    # Max node tasks alive at once during plan execution; further ready nodes queue (highest fanout first)
+    MAX_RUNNING_NODES: int = _EnvSetting(lambda: int(os.getenv("MAX_RUNNING_NODES", "64")))
+
+    # Opt-in: when at least this many dependency-free nodes on the same provider/model are
+    # ready together, answer them with one combined LLM call (FUSE_THRESHOLD=0 disables)
+    FUSE_THRESHOLD: int = _EnvSetting(lambda: int(os.getenv("FUSE_THRESHOLD", "0")))
 
     # Default models per provider
     DEFAULT_MODELS = {
@@ -100,6 +161,14 @@ class Config:
         return key_map.get(provider.lower())
     
     @classmethod
+    def get_max_concurrency(cls, provider: str) -> int:
+        """Get the concurrent request limit for a provider."""
+        return cls.MAX_CONCURRENT_PER_PROVIDER.get(provider.lower(), int(os.getenv("MAX_CONCURRENT_PER_PROVIDER", "10")))
+    
+    # Keys are read once per process, so availability is computed once too.
+    # The cached dict/list are shared between callers: treat them as read-only.
+    @classmethod
+    @lru_cache(maxsize=1)
     def get_available_providers(cls) -> Dict[str, bool]:
         """Check which providers have API keys configured."""
         return {
@@ -111,7 +180,14 @@ class Config:
         }
     
     @classmethod
+    @lru_cache(maxsize=1)
     def get_available_provider_names(cls) -> List[str]:
         """Get list of available provider names."""
         available = cls.get_available_providers()
-        return [name for name, is_available in available.items() if is_available]
\ No newline at end of file
+        return [name for name, is_available in available.items() if is_available]
+    
+    @classmethod
+    @lru_cache(maxsize=1)
+    def get_available_provider_set(cls) -> FrozenSet[str]:
+        """Get available provider names as a frozenset for O(1) membership checks."""
+        return frozenset(cls.get_available_provider_names())
\ No newline at end of file
@@ -1,198 +1,478 @@
 """DAG executor with parallel execution support."""
 import asyncio
+import graphlib
+import heapq
+import logging
+import re
+import sys
 import time
-from collections import defaultdict, deque
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Tuple
 from .models import Node, Plan, NodeStatus
-from .providers.factory import create_provider
+from .providers.factory import get_provider
 from .prompts import load_prompt, format_prompt
+from .config import Config
+from .llm_cache import LLMCache
+
+logger = logging.getLogger(__name__)
+
+# Exact-match response cache shared by every executor in the process, so re-running
+# a plan (or a sibling plan with identical nodes) skips the repeated LLM calls
+RESPONSE_CACHE = LLMCache(maxsize=1024, ttl=3600)
+
+# Structural nodes that only stitch their inputs together ("Combine the results", "Merge outputs ...")
+_DIRECT_COMBINE_RE = re.compile(r"^\s*(?:combine|concatenate|merge|join|collect)\b", re.IGNORECASE)
+
+# One answer section of a fused call (see fused_execution_system.txt)
+_FUSED_ANSWER_RE = re.compile(r"<<<TASK (\d+)>>>\s*(.*?)\s*<<<END TASK \1>>>", re.DOTALL)
+
+
+_console_handler = None
+
+
+def enable_console_log(level: int = logging.INFO):
+    """Echo executor progress to stderr as "[EXEC] ..." lines (for the CLI and dev server)."""
+    global _console_handler
+    if _console_handler is None:
+        _console_handler = logging.StreamHandler()
+        _console_handler.setFormatter(logging.Formatter("[EXEC] %(message)s"))
+        logger.addHandler(_console_handler)
+        logger.propagate = False
+    logger.setLevel(level)
 
 
 class DAGExecutor:
     """Executes DAG plans with proper parallelization."""
     
-    def __init__(self):
-        self.running_tasks: Dict[str, asyncio.Task] = {}
+    def __init__(self, fuse_threshold: Optional[int] = None):
+        # Min group size for fusing independent nodes into one LLM call (0 disables; default from Config)
+        self.fuse_threshold = Config.FUSE_THRESHOLD if fuse_threshold is None else fuse_threshold
         self.node_results: Dict[str, str] = {}  # node_id -> natural language result
+        self.node_by_id: Dict[str, Node] = {}  # filled per plan in execute()
+        # dep_id -> "From <name> (<id>):\n<result>", formatted once and shared by every consumer
+        self._input_snippets: Dict[str, str] = {}
+        # Single-flight: cache key -> future of the identical LLM call already in progress
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.execution_logs: List[str] = []
     
     def _log(self, message: str):
-        """Add log message."""
+        """Add log message (kept in execution_logs and sent to this module's logger)."""
         self.execution_logs.append(message)
-        print(f"[EXEC] {message}")
+        logger.info(message)
     
-    def _build_dependency_graph(self, plan: Plan) -> Dict[str, Set[str]]:
-        """Build dependency graph: node_id -> set of nodes that depend on it."""
-        dependents = defaultdict(set)
+    def _build_dependency_graph(self, plan: Plan) -> Tuple[Dict[str, int], List[List[int]], List[int]]:
+        """Build an index-based dependency graph in one pass over the edges.
+        
+        Nodes are addressed by their position in plan.nodes. Returns (id_to_idx,
+        dependents, in_degree): dependents[i] lists the nodes that depend on node i,
+        in_degree[i] is the number of distinct dependencies node i is still waiting on.
+        A dependency on an id that isn't in the plan counts but can never be satisfied.
+        
+        Node ids are interned first: node_results, node_by_id and the input snippets
+        are keyed by them, so every later lookup matches on identity instead of
+        comparing string contents.
+        """
+        intern = sys.intern
         for node in plan.nodes:
-            for dep_id in node.dependencies:
-                dependents[dep_id].add(node.id)
-        return dependents
+            node.id = intern(node.id)
+            node.dependencies = [intern(dep_id) for dep_id in node.dependencies]
+        id_to_idx = {node.id: i for i, node in enumerate(plan.nodes)}
+        dependents: List[List[int]] = [[] for _ in plan.nodes]
+        in_degree = [0] * len(plan.nodes)
+        for i, node in enumerate(plan.nodes):
+            deps = set(node.dependencies)
+            in_degree[i] = len(deps)
+            for dep_id in deps:
+                dep = id_to_idx.get(dep_id)
+                if dep is not None:
+                    dependents[dep].append(i)
+        return id_to_idx, dependents, in_degree
     
-    def _get_ready_nodes(self, plan: Plan, completed: Set[str]) -> List[Node]:
-        """Get nodes that are ready to execute (all dependencies completed)."""
-        ready = []
-        for node in plan.nodes:
-            if node.id in completed or node.status == NodeStatus.COMPLETED:
-                continue
-            if node.status in [NodeStatus.PENDING, NodeStatus.READY]:
-                # Check if all dependencies are completed
-                if all(dep_id in completed for dep_id in node.dependencies):
-                    ready.append(node)
-        return ready
+    def _transitive_fanout(self, dependents: List[List[int]], in_degree: List[int]) -> List[int]:
+        """Number of nodes downstream of each node (directly or transitively).
+        
+        Descendant sets are int bitmasks merged in reverse topological order; nodes
+        on a cycle are left at 0 since they never run anyway.
+        """
+        remaining = list(in_degree)
+        order = [i for i, degree in enumerate(remaining) if degree == 0]
+        for i in order:  # Kahn's algorithm; `order` grows while we walk it
+            for child in dependents[i]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    order.append(child)
+        descendants = [0] * len(dependents)
+        for i in reversed(order):
+            mask = 0
+            for child in dependents[i]:
+                mask |= (1 << child) | descendants[child]
+            descendants[i] = mask
+        return [mask.bit_count() for mask in descendants]
+    
+    def _find_cycle(self, plan: Plan) -> Optional[List[str]]:
+        """Return one dependency cycle as a list of node ids, or None if the plan is acyclic."""
+        sorter = graphlib.TopologicalSorter({node.id: node.dependencies for node in plan.nodes})
+        try:
+            sorter.prepare()
+        except graphlib.CycleError as e:
+            return e.args[1]
+        return None
     
     def _prepare_node_inputs(self, node: Node, plan: Plan) -> str:
         """Prepare inputs for a node based on its dependencies in natural language."""
         if not node.dependencies:
             return ""
         
-        # Collect outputs from dependency nodes
-        input_parts = []
-        for dep_id in node.dependencies:
-            if dep_id in self.node_results:
-                dep_result = self.node_results[dep_id]
-                # Get the dependency node name for context
-                dep_node = next((n for n in plan.nodes if n.id == dep_id), None)
-                dep_name = dep_node.name if dep_node else dep_id
-                
-                # Add dependency result as natural language
-                input_parts.append(f"From {dep_name} ({dep_id}):\n{dep_result}")
-            else:
+        snippets = self._input_snippets
+        missing = [dep_id for dep_id in node.dependencies if dep_id not in snippets]
+        for dep_id in missing:
+            dep_result = self.node_results.get(dep_id)
+            if dep_result is None:
                 raise ValueError(f"Dependency {dep_id} result not found for node {node.id}")
+            # Get the dependency node name for context
+            dep_node = self.node_by_id.get(dep_id)
+            dep_name = dep_node.name if dep_node else dep_id
+            
+            # Dependency result as natural language
+            snippets[dep_id] = f"From {dep_name} ({dep_id}):\n{dep_result}"
         
-        return "\n\n".join(input_parts)
+        return "\n\n".join([snippets[dep_id] for dep_id in node.dependencies])
+    
+    def _build_prompts(self, node: Node, inputs_text: str) -> Tuple[str, str]:
+        """Build the (user prompt, system prompt) pair for a node; pure and cheap.
+        
+        Keeping this separate from the provider call means identical nodes produce
+        identical keys for the response cache and in-flight coalescing.
+        """
+        # Build execution prompt using template
+        template = load_prompt("node_execution_user.txt")
+        
+        # Build sections
+        output_description_section = ""
+        if node.output_description:
+            output_description_section = f"\nWhat you need to produce: {node.output_description}"
+        
+        input_description_section = ""
+        if node.input_description:
+            input_description_section = f"\nWhat you need as input: {node.input_description}"
+        
+        inputs_section = ""
+        if inputs_text:
+            inputs_section = f"\n\nInputs from previous tasks:\n{inputs_text}"
+        
+        note_section = ""
+        if not inputs_text and node.dependencies:
+            note_section = "\n\nNote: You have dependencies but their results are not yet available."
+        
+        prompt = format_prompt(
+            template,
+            description=node.description,
+            output_description_section=output_description_section,
+            input_description_section=input_description_section,
+            inputs_section=inputs_section,
+            note_section=note_section
+        )
+        
+        # Load system prompt template
+        system_template = load_prompt("node_execution_system.txt")
+        system_prompt = format_prompt(system_template, node_name=node.name)
+        
+        return prompt, system_prompt
     
     async def _execute_node(self, node: Node, plan: Plan) -> str:
         """Execute a single node and return natural language result."""
         node.status = NodeStatus.RUNNING
         self._log(f"Starting node {node.id}: {node.name}")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Prepare inputs in natural language
             inputs_text = self._prepare_node_inputs(node, plan)
             
-            # Create provider
-            provider = create_provider(node.provider)
-            
-            # Build execution prompt using template
-            template = load_prompt("node_execution_user.txt")
-            
-            # Build sections
-            output_description_section = ""
-            if node.output_description:
-                output_description_section = f"\nWhat you need to produce: {node.output_description}"
+            if Config.DIRECT_NODES_ENABLED:
+                direct = self._try_direct(node, inputs_text)
+                if direct is not None:
+                    return self._complete_node(node, direct, start_time, source="direct")
             
-            input_description_section = ""
-            if node.input_description:
-                input_description_section = f"\nWhat you need as input: {node.input_description}"
+            # Reuse the provider (and its HTTP client) across nodes and plans
+            provider = get_provider(node.provider)
+            prompt, system_prompt = self._build_prompts(node, inputs_text)
             
-            inputs_section = ""
-            if inputs_text:
-                inputs_section = f"\n\nInputs from previous tasks:\n{inputs_text}"
-            
-            note_section = ""
-            if not inputs_text and node.dependencies:
-                note_section = "\n\nNote: You have dependencies but their results are not yet available."
-            
-            prompt = format_prompt(
-                template,
-                description=node.description,
-                output_description_section=output_description_section,
-                input_description_section=input_description_section,
-                inputs_section=inputs_section,
-                note_section=note_section
-            )
-            
-            # Load system prompt template
-            system_template = load_prompt("node_execution_system.txt")
-            system_prompt = format_prompt(system_template, node_name=node.name)
-            
-            response = await provider.generate(
-                prompt=prompt,
-                model=node.model,
-                system_prompt=system_prompt
-            )
+            response = await self._cached_generate(provider, node, prompt, system_prompt)
             
             # Response is already natural language, no JSON parsing needed
-            result = response.strip()
-            
-            execution_time = time.time() - start_time
-            node.execution_time = execution_time
-            node.status = NodeStatus.COMPLETED
-            node.result = result
-            
-            self._log(f"Completed node {node.id}: {node.name} (took {execution_time:.2f}s)")
-            return result
+            return self._complete_node(node, response.strip(), start_time)
             
         except Exception as e:
             node.status = NodeStatus.FAILED
             node.error = str(e)
-            execution_time = time.time() - start_time
+            node.execution_time = time.perf_counter() - start_time
             self._log(f"Failed node {node.id}: {node.name} - {e}")
             raise
     
+    def _complete_node(self, node: Node, result: str, start_time: float, source: str = "llm") -> str:
+        """Record a node's result and timing (start_time is a perf_counter() reading)."""
+        execution_time = time.perf_counter() - start_time
+        node.execution_time = execution_time
+        node.status = NodeStatus.COMPLETED
+        node.result = result
+        
+        via = "" if source == "llm" else f", {source}"
+        self._log(f"Completed node {node.id}: {node.name} (took {execution_time:.2f}s{via})")
+        return result
+    
+    def _fusion_groups(self, indices: List[int], nodes: List[Node]) -> List[List[int]]:
+        """Split nodes being dispatched together into call groups.
+        
+        Dependency-free nodes sharing a provider and model are grouped when at least
+        fuse_threshold of them are ready at once; every other node runs on its own.
+        """
+        if self.fuse_threshold < 2 or len(indices) < self.fuse_threshold:
+            return [[i] for i in indices]
+        groups: List[List[int]] = []
+        fusable: Dict[Tuple[str, str], List[int]] = {}
+        for i in indices:
+            node = nodes[i]
+            if node.dependencies:
+                groups.append([i])
+            else:
+                fusable.setdefault((node.provider, node.model), []).append(i)
+        for members in fusable.values():
+            if len(members) >= self.fuse_threshold:
+                groups.append(members)
+            else:
+                groups.extend([i] for i in members)
+        return groups
+    
+    async def _execute_fused(self, group: List[Node], plan: Plan) -> List[Optional[str]]:
+        """Execute independent nodes with one combined LLM call.
+        
+        Returns each node's result, or None for a node that failed (already logged).
+        If the call fails or its answer can't be split into one section per node,
+        the nodes are executed separately instead.
+        """
+        names = ", ".join(node.name for node in group)
+        self._log(f"Fusing {len(group)} nodes into one call: {[node.id for node in group]}")
+        for node in group:
+            node.status = NodeStatus.RUNNING
+        start_time = time.perf_counter()
+        
+        answers = None
+        try:
+            sections = []
+            for n, node in enumerate(group, 1):
+                prompt, _ = self._build_prompts(node, self._prepare_node_inputs(node, plan))
+                sections.append(f"<<<TASK {n}>>>\n{prompt}\n<<<END TASK {n}>>>")
+            system_prompt = format_prompt(load_prompt("fused_execution_system.txt"), node_names=names)
+            provider = get_provider(group[0].provider)
+            response = await self._cached_generate(provider, group[0], "\n\n".join(sections), system_prompt)
+            answers = self._split_fused(response, len(group))
+            if answers is None:
+                self._log(f"Fused answer for {names} did not match the task markers; running them separately")
+        except Exception as e:
+            self._log(f"Fused call for {names} failed ({e}); running them separately")
+        
+        if answers is None:
+            results = await asyncio.gather(*(self._execute_node(node, plan) for node in group), return_exceptions=True)
+            return [None if isinstance(r, Exception) else r for r in results]
+        return [self._complete_node(node, answer, start_time, source=f"fused x{len(group)}")
+                for node, answer in zip(group, answers)]
+    
+    @staticmethod
+    def _split_fused(response: str, count: int) -> Optional[List[str]]:
+        """Answers 1..count from a fused response, or None unless each appears exactly once."""
+        answers: Dict[int, str] = {}
+        for match in _FUSED_ANSWER_RE.finditer(response):
+            n = int(match.group(1))
+            if n in answers or not 1 <= n <= count:
+                return None
+            answers[n] = match.group(2)
+        if len(answers) != count:
+            return None
+        return [answers[n] for n in range(1, count + 1)]
+    
+    def _try_direct(self, node: Node, inputs_text: str) -> Optional[str]:
+        """Resolve purely structural nodes without an LLM call, or return None.
+        
+        Only a node whose description starts with combine/concatenate/merge/join/collect
+        and that has every dependency result in hand qualifies: its result is the
+        dependency outputs, labelled and concatenated.
+        """
+        if not node.dependencies or not inputs_text:
+            return None
+        if not _DIRECT_COMBINE_RE.match(node.description):
+            return None
+        return inputs_text
+    
+    async def _generate(self, provider, node: Node, prompt: str, system_prompt: str) -> str:
+        """provider.generate, or a streamed call when the provider supports it.
+        
+        Concurrency and rate limits are applied inside the provider (see AIProvider.limited),
+        so they hold across every executor and the planner in this process.
+        """
+        if not getattr(provider, "supports_streaming", False):
+            return await provider.generate(prompt=prompt, model=node.model, system_prompt=system_prompt)
+        return await self._generate_streamed(provider, node, prompt, system_prompt)
+    
+    async def _generate_streamed(self, provider, node: Node, prompt: str, system_prompt: str) -> str:
+        """Collect a streamed response, logging time to first token."""
+        start = time.perf_counter()
+        chunks: List[str] = []
+        async for chunk in provider.generate_stream(prompt=prompt, model=node.model, system_prompt=system_prompt):
+            if not chunks:
+                self._log(f"Node {node.id}: first tokens after {time.perf_counter() - start:.2f}s")
+            chunks.append(chunk)
+        return "".join(chunks)
+    
+    async def _cached_generate(self, provider, node: Node, prompt: str, system_prompt: str) -> str:
+        """provider.generate with an exact-match cache in front (skipped when LLM_CACHE=0)."""
+        if not Config.LLM_CACHE_ENABLED:
+            return await self._generate(provider, node, prompt, system_prompt)
+        
+        key = LLMCache.make_key(node.provider, node.model, system_prompt, prompt)
+        cached = RESPONSE_CACHE.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            self._log(f"Cache hit for node {node.id}")
+            return cached
+        self.cache_misses += 1
+        
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._log(f"Node {node.id} joined an identical in-flight request")
+            # shield: a cancelled joiner must not cancel the request for everyone else
+            return await asyncio.shield(pending)
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            response = await self._generate(provider, node, prompt, system_prompt)
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # joiners re-raise it; don't warn if there were none
+            raise
+        except BaseException:
+            fut.cancel()
+            raise
+        finally:
+            del self._inflight[key]
+        fut.set_result(response)
+        
+        RESPONSE_CACHE.set(key, response)
+        return response
+    
     async def execute(self, plan: Plan) -> Dict:
         """Execute a plan with parallel execution."""
         # Validate all nodes have available providers
-        from .config import Config
-        available_providers = Config.get_available_provider_names()
+        available = Config.get_available_provider_set()
         
         for node in plan.nodes:
-            if node.provider not in available_providers:
+            if node.provider not in available:
+                available_providers = Config.get_available_provider_names()
                 raise ValueError(f"Node {node.id} uses unavailable provider '{node.provider}'. Available: {', '.join(available_providers)}")
         
         self._log(f"Starting execution of plan {plan.plan_id}")
         plan.status = "executing"
         
-        completed: Set[str] = set()
-        dependents = self._build_dependency_graph(plan)
+        nodes = plan.nodes
+        # Unfinished dependencies per node index; a node is dispatched the moment this hits zero
+        id_to_idx, dependents, in_degree = self._build_dependency_graph(plan)
+        completed = bytearray(len(nodes))  # completion bitmap by node index
+        n_completed = 0
+        self.node_by_id = {node.id: node for node in nodes}
+        self._input_snippets.clear()
+        cycle = self._find_cycle(plan)
+        if cycle:
+            # Nodes on (or downstream of) the cycle can never become ready; the rest still run
+            self._log(f"ERROR: Dependency cycle in plan: {' -> '.join(cycle)}")
         
         # Initialize node results dict (will store natural language strings)
         for node in plan.nodes:
             self.node_results[node.id] = ""
         
-        # Execute nodes in waves of parallelism
-        while len(completed) < len(plan.nodes):
-            # Get all ready nodes
-            ready_nodes = self._get_ready_nodes(plan, completed)
-            
-            if not ready_nodes:
-                # Check if we're stuck (all remaining nodes have failed dependencies)
-                remaining = [n for n in plan.nodes if n.id not in completed and n.status != NodeStatus.FAILED]
-                if remaining:
-                    failed_deps = []
-                    for node in remaining:
-                        failed_deps.extend([d for d in node.dependencies if d not in completed])
-                    if failed_deps:
-                        self._log(f"ERROR: Cannot proceed - dependencies failed: {failed_deps}")
-                        break
+        running: Dict[asyncio.Task, List[int]] = {}  # task -> node indices (several for a fused call)
+        # Finished tasks are pushed here by a done-callback, so each completion costs O(1)
+        # instead of asyncio.wait() re-registering callbacks on every running task
+        finished: asyncio.Queue = asyncio.Queue()
+        
+        # Start nodes that unblock the most downstream work first: when a concurrency
+        # limit is the bottleneck, they get the free slots ahead of leaf nodes
+        fanout = self._transitive_fanout(dependents, in_degree)
+        # Ready nodes wait here as (-fanout, index) until a slot frees up, so a wide plan
+        # never has more than MAX_RUNNING_NODES node tasks alive at once
+        ready_heap: List[Tuple[int, int]] = []
+        max_running = Config.MAX_RUNNING_NODES
+        
+        def dispatch(ready: List[int]):
+            for i in ready:
+                heapq.heappush(ready_heap, (-fanout[i], i))
+            started = []
+            while ready_heap and len(running) + len(started) < max_running:
+                started.append(heapq.heappop(ready_heap)[1])
+            for group in self._fusion_groups(started, nodes):
+                if len(group) == 1:
+                    task = asyncio.create_task(self._execute_node(nodes[group[0]], plan))
                 else:
-                    break
-            
-            # Execute all ready nodes in parallel
-            self._log(f"Executing {len(ready_nodes)} nodes in parallel: {[n.id for n in ready_nodes]}")
-            
-            tasks = []
-            for node in ready_nodes:
-                task = asyncio.create_task(self._execute_node(node, plan))
-                tasks.append((node.id, task))
-            
-            # Wait for all tasks in this wave
-            for node_id, task in tasks:
-                try:
-                    result = await task
-                    # Store natural language result
-                    self.node_results[node_id] = result if isinstance(result, str) else str(result)
-                    completed.add(node_id)
-                except Exception as e:
-                    self._log(f"Node {node_id} failed: {e}")
-                    # Mark as failed but continue with other nodes if possible
+                    task = asyncio.create_task(self._execute_fused([nodes[i] for i in group], plan))
+                task.add_done_callback(finished.put_nowait)
+                running[task] = group
+            if started:
+                queued = f", {len(ready_heap)} queued" if ready_heap else ""
+                self._log(f"Dispatching {len(started)} ready nodes{queued}: {[f'{nodes[i].id} (fanout {fanout[i]})' for i in started]}")
+        
+        # Continuous scheduling: no waves — each completion immediately releases its dependents
+        # Like a TaskGroup, node tasks never outlive execute(): if it is cancelled (or
+        # fails), whatever is still running is cancelled and awaited before returning
+        try:
+            dispatch([i for i, degree in enumerate(in_degree) if degree == 0])
+            while running:
+                done = [await finished.get()]
+                while not finished.empty():
+                    done.append(finished.get_nowait())
+                newly_ready = []
+                for task in done:
+                    group = running.pop(task)
+                    try:
+                        outcome = task.result()
+                    except Exception as e:
+                        self._log(f"Node {nodes[group[0]].id} failed: {e}")
+                        # Mark as failed but continue with other nodes if possible
+                        continue
+                    # A fused task returns one result per node (None where that node failed)
+                    for i, result in zip(group, outcome if len(group) > 1 else [outcome]):
+                        if result is None:
+                            continue
+                        # Store natural language result
+                        self.node_results[nodes[i].id] = result if isinstance(result, str) else str(result)
+                        completed[i] = 1
+                        n_completed += 1
+                        for child in dependents[i]:
+                            in_degree[child] -= 1
+                            if in_degree[child] == 0:
+                                newly_ready.append(child)
+                dispatch(newly_ready)
+        finally:
+            if running:
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+        
+        # Anything left never became ready because a dependency failed (or doesn't exist)
+        blocked = [n for i, n in enumerate(nodes) if not completed[i] and n.status != NodeStatus.FAILED]
+        if blocked:
+            failed_deps = sorted({
+                d for n in blocked for d in n.dependencies
+                if d not in id_to_idx or not completed[id_to_idx[d]]
+            })
+            self._log(f"ERROR: Cannot proceed - dependencies failed or never completed: {failed_deps}")
         
         # Finalize
-        plan.status = "completed" if len(completed) == len(plan.nodes) else "failed"
+        plan.status = "completed" if n_completed == len(nodes) else "failed"
         self._log(f"Execution completed. Status: {plan.status}")
+        if self.cache_hits or self.cache_misses:
+            self._log(f"LLM cache: {self.cache_hits} hits, {self.cache_misses} misses")
         
         # Aggregate results (all in natural language)
         final_result = {
@@ -0,0 +1,47 @@
+"""In-process cache of LLM responses keyed on the exact request."""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class LLMCache:
+    """LRU cache of response text with a time-to-live.
+
+    Keys come from make_key(); an entry older than `ttl` seconds is treated as
+    missing. hits/misses count lookups over the cache's lifetime.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()  # key -> (expires_at, text)
+
+    @staticmethod
+    def make_key(provider: str, model: str, system_prompt: str, prompt: str) -> str:
+        """sha256 over the fields that determine a response."""
+        return hashlib.sha256("\x00".join((provider, model, system_prompt or "", prompt)).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None on a miss or expired entry."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: str):
+        """Store a response, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
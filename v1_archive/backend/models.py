@@ -1,7 +1,12 @@
 """Data models for DAG nodes, plans, and execution state."""
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Nodes and plans are validated once, when built from planner/API/cache JSON. After
+# that the executor mutates them constantly (status, result, timing), so keep those
+# writes plain attribute sets and don't re-check nested Node instances inside Plan.
+_HOT_MODEL_CONFIG = ConfigDict(validate_assignment=False, revalidate_instances="never")
 
 
 class NodeStatus(str, Enum):
@@ -15,6 +20,8 @@ class NodeStatus(str, Enum):
 
 class Node(BaseModel):
     """A node in the DAG representing a task."""
+    model_config = _HOT_MODEL_CONFIG
+    
     id: str
     name: str
     description: str
@@ -35,6 +42,8 @@ class Node(BaseModel):
 
 class Plan(BaseModel):
     """A complete execution plan with DAG structure."""
+    model_config = _HOT_MODEL_CONFIG
+    
     plan_id: str
     user_prompt: str
     title: Optional[str] = None  # Short title for the plan
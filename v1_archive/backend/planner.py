@@ -1,15 +1,32 @@
 """AI planner that creates DAG from user prompts."""
 import json
+import re
 import uuid
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from .models import Node, Plan, NodeStatus
-from .providers.factory import create_provider
+from .providers.factory import get_provider
 from .config import Config
 from .prompts import load_prompt, format_prompt
 
+try:
+    # Optional speedup; orjson.JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Markdown-fenced reply: drop the opening ``` line and a closing fence on the last line
+_FENCE_RE = re.compile(r"\A\s*```[^\n]*\n?(.*?)(?:\n```[^\n]*)?\s*\Z", re.DOTALL)
+
 
 def get_planner_system_prompt(available_providers: List[str], forced_provider: str = None, forced_model: str = None) -> str:
     """Generate planner system prompt with available providers."""
+    return _planner_system_prompt(tuple(available_providers), forced_provider, forced_model)
+
+
+@lru_cache(maxsize=32)
+def _planner_system_prompt(available_providers: Tuple[str, ...], forced_provider: Optional[str], forced_model: Optional[str]) -> str:
+    # Pure function of its (hashable) inputs, so each combination is formatted once
     providers_str = "|".join(available_providers) if available_providers else "openai"
     
     provider_constraint = ""
@@ -32,9 +49,10 @@ class Planner:
     def __init__(self, provider_name: str = "openai", model: str = None):
         """Initialize planner with AI provider."""
         self.provider_name = provider_name
-        self.provider = create_provider(provider_name)
+        self.provider = get_provider(provider_name)
         self.model = model or Config.DEFAULT_MODELS.get(provider_name, "gpt-4o-mini")
         self.available_providers = Config.get_available_provider_names()
+        self._providers_key = tuple(self.available_providers)  # hashable, for the prompt cache
     
     async def create_plan(self, user_prompt: str, force_provider: str = None, force_model: str = None) -> Plan:
         """Create a DAG plan from user prompt.
@@ -49,11 +67,7 @@ class Planner:
         forced_model = force_model or self.model
         
         # Get system prompt with available providers and forced provider/model
-        system_prompt = get_planner_system_prompt(
-            self.available_providers,
-            forced_provider=forced_provider,
-            forced_model=forced_model
-        )
+        system_prompt = _planner_system_prompt(self._providers_key, forced_provider, forced_model)
         
         provider_note = ""
         if forced_provider and forced_model:
@@ -75,13 +89,11 @@ class Planner:
             )
             
             # Extract JSON from response (handle markdown code blocks)
-            response = response.strip()
-            if response.startswith("```"):
-                # Remove markdown code blocks
-                lines = response.split("\n")
-                response = "\n".join(lines[1:-1]) if lines[-1].startswith("```") else "\n".join(lines[1:])
+            fenced = _FENCE_RE.match(response)
+            if fenced:
+                response = fenced.group(1)
             
-            plan_data = json.loads(response)
+            plan_data = _json_loads(response)
             
             # Create nodes and validate providers
             nodes = []
@@ -95,7 +107,7 @@ class Planner:
                     model = node_data.get("model", Config.DEFAULT_MODELS.get(provider))
                 
                 # Validate provider is available
-                if provider not in self.available_providers:
+                if provider not in Config.get_available_provider_set():
                     # Fallback to first available provider
                     if self.available_providers:
                         provider = self.available_providers[0]
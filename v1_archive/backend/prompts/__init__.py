@@ -1,11 +1,13 @@
 """Prompt templates for the AI orchestration framework."""
+from functools import lru_cache
 from pathlib import Path
 
 PROMPTS_DIR = Path(__file__).parent
 
 
+@lru_cache(maxsize=None)
 def load_prompt(filename: str) -> str:
-    """Load a prompt template from file."""
+    """Load a prompt template from file (read once per process)."""
     file_path = PROMPTS_DIR / filename
     if not file_path.exists():
         raise FileNotFoundError(f"Prompt file not found: {filename}")
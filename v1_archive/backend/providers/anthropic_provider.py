@@ -16,16 +16,17 @@ class AnthropicProvider(AIProvider):
         """Generate response using Anthropic API."""
         # Anthropic doesn't have async client yet, run in executor
         loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.client.messages.create(
-                model=model,
-                max_tokens=4096,
-                system=system_prompt or "",
-                messages=[{"role": "user", "content": prompt}],
-                **kwargs
+        async with self.limited(prompt, system_prompt, 4096):
+            response = await loop.run_in_executor(
+                None,
+                lambda: self.client.messages.create(
+                    model=model,
+                    max_tokens=4096,
+                    system=system_prompt or "",
+                    messages=[{"role": "user", "content": prompt}],
+                    **kwargs
+                )
             )
-        )
         
         # Handle response
         if not response.content or len(response.content) == 0:
@@ -1,20 +1,68 @@
 """Base class for AI providers."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager, nullcontext
+from typing import Dict, Any, AsyncIterator, Optional
+from .rate_limit import TokenBucket
+
+DEFAULT_MAX_TOKENS = 4096
 
 
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
     
+    # True when generate_stream yields text incrementally rather than all at once
+    supports_streaming = False
+    
+    # Process-wide limits shared by every caller of this instance (see set_limits)
+    _sem: Optional[asyncio.Semaphore] = None
+    _rpm: Optional[TokenBucket] = None
+    _tpm: Optional[TokenBucket] = None
+    
     def __init__(self, api_key: str, **kwargs):
         self.api_key = api_key
         self.kwargs = kwargs
     
+    def set_limits(self, max_concurrency: Optional[int] = None, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        """Cap in-flight calls and pace requests/tokens per minute (None or 0 = unlimited)."""
+        self._sem = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._rpm = TokenBucket(rpm) if rpm else None
+        self._tpm = TokenBucket(tpm) if tpm else None
+    
+    @asynccontextmanager
+    async def limited(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: Optional[int] = None):
+        """Hold a concurrency slot and rate-limit budget around one API call.
+        
+        Excess calls queue here instead of piling onto the connection pool and
+        coming back as 429s. Token use is estimated as ~4 characters per token
+        plus the completion budget.
+        """
+        async with self._sem or nullcontext():
+            if self._rpm is not None:
+                await self._rpm.acquire(1)
+            if self._tpm is not None:
+                prompt_chars = len(prompt) + len(system_prompt or "")
+                await self._tpm.acquire(prompt_chars // 4 + (max_tokens or DEFAULT_MAX_TOKENS))
+            yield
+    
     @abstractmethod
     async def generate(self, prompt: str, model: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """Generate a response from the AI model."""
         pass
     
+    async def generate_stream(
+        self, prompt: str, model: str, system_prompt: Optional[str] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Yield the response text as it is produced.
+        
+        The default yields the whole generate() result once; providers with a
+        streaming API override this and set supports_streaming.
+        """
+        yield await self.generate(prompt, model, system_prompt=system_prompt, **kwargs)
+    
+    async def aclose(self):
+        """Release network resources held by this provider (no-op by default)."""
+    
     @abstractmethod
     def get_available_models(self) -> list[str]:
         """Get list of available models for this provider."""
@@ -1,11 +1,12 @@
 """Factory for creating AI provider instances."""
-from typing import Optional
+from typing import Dict, Optional
 from .base import AIProvider
 from .openai_provider import OpenAIProvider
 from .anthropic_provider import AnthropicProvider
 from .gemini_provider import GeminiProvider
 from .minimax_provider import MinimaxProvider
 from .openrouter_provider import OpenRouterProvider
+from .http_client import close_http_client
 from ..config import Config
 
 
@@ -46,3 +47,34 @@ def create_provider(provider_name: str, **kwargs) -> Optional[AIProvider]:
 
     else:
         raise ValueError(f"Unknown provider: {provider_name}")
+
+
+# Lowercased provider name -> instance handed out by get_provider()
+_SHARED_PROVIDERS: Dict[str, AIProvider] = {}
+
+
+def get_provider(provider_name: str) -> AIProvider:
+    """Shared provider instance for `provider_name` using the configured API key.
+    
+    Planner and executors all reuse one instance (and its HTTP client and connection
+    pool) per provider for the life of the process, and so share its concurrency
+    cap and rate limits from Config. Use create_provider() for a private, unlimited
+    instance or a non-default key.
+    """
+    provider_name = provider_name.lower()
+    provider = _SHARED_PROVIDERS.get(provider_name)
+    if provider is None:
+        provider = create_provider(provider_name)
+        rpm, tpm = Config.RATE_LIMITS.get(provider_name, (0, 0))
+        provider.set_limits(Config.get_max_concurrency(provider_name), rpm, tpm)
+        _SHARED_PROVIDERS[provider_name] = provider
+    return provider
+
+
+async def close_providers():
+    """Close and drop the shared provider instances and their pooled connections (app shutdown)."""
+    providers = list(_SHARED_PROVIDERS.values())
+    _SHARED_PROVIDERS.clear()
+    for provider in providers:
+        await provider.aclose()
+    await close_http_client()
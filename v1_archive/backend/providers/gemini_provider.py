@@ -1,78 +1,139 @@
 """Google Gemini provider implementation."""
 import google.genai as genai
 import asyncio
-from typing import Optional
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Optional
 from .base import AIProvider
 
+try:
+    from google.genai import types as genai_types
+except ImportError:  # older SDKs without typed request configs
+    genai_types = None
+
+
+# Known response shapes, most common first. Each returns the text, or None / raises
+# if the response doesn't have that shape.
+_EXTRACTORS = (
+    lambda r: r.text or None,
+    lambda r: r.candidates[0].content.parts[0].text,
+    lambda r: r.candidates[0].content.text,
+    lambda r: r.content if isinstance(r.content, str) else r.content.text,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _system_config(system_prompt: str):
+    """GenerateContentConfig carrying the system prompt (built once per distinct prompt)."""
+    return genai_types.GenerateContentConfig(system_instruction=system_prompt)
+
+
+def _try_extract(extractor, response) -> Optional[str]:
+    try:
+        return extractor(response)
+    except (AttributeError, IndexError, KeyError, TypeError):
+        return None
+
 
 class GeminiProvider(AIProvider):
     """Google Gemini API provider."""
     
+    # Only used when the installed SDK has no async client: sync calls get their own
+    # pool instead of queueing on the loop's small default executor
+    _EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="gemini")
+    
     def __init__(self, api_key: str):
         super().__init__(api_key)
         self.api_key = api_key
         # Initialize client - google.genai uses Client with api_key
         self.client = genai.Client(api_key=api_key)
+        
+        self._extractor_idx: Optional[int] = None  # index into _EXTRACTORS that matched last
+        
+        # Pick the API surface once instead of probing it on every call.
+        # Native async API (client.aio) in current google-genai releases:
+        aio = getattr(self.client, "aio", None)
+        self._agenerate_fn = aio.models.generate_content if aio is not None else None
+        self._astream_fn = getattr(aio.models, "generate_content_stream", None) if aio is not None else None
+        self.supports_streaming = self._astream_fn is not None
+        # Synchronous fallback: client.models.generate_content, or per-model access on older SDKs
+        if hasattr(self.client, "models"):
+            self._generate_fn = self.client.models.generate_content
+        else:
+            self._generate_fn = lambda model, contents, **kw: self.client.get_model(model).generate_content(contents, **kw)
+        # Send system prompts as a system_instruction when the SDK's models API takes one
+        self._native_system = (
+            genai_types is not None and hasattr(genai_types, "GenerateContentConfig")
+            and hasattr(self.client, "models")
+        )
+    
+    def _request_kwargs(self, prompt: str, system_prompt: Optional[str], kwargs: dict) -> dict:
+        """contents/config for generate_content.
+        
+        The system prompt goes in config.system_instruction; it is only prepended to
+        the prompt text on SDKs without that, or when the caller passed its own config.
+        """
+        if not system_prompt:
+            return {"contents": prompt, **kwargs}
+        if self._native_system and "config" not in kwargs:
+            return {"contents": prompt, "config": _system_config(system_prompt), **kwargs}
+        return {"contents": f"{system_prompt}\n\n{prompt}", **kwargs}
     
     async def generate(self, prompt: str, model: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """Generate response using Gemini API."""
-        # Combine system prompt with user prompt
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
-        
-        # google.genai API - run in executor since it's synchronous
-        loop = asyncio.get_event_loop()
+        request = self._request_kwargs(prompt, system_prompt, kwargs)
         
-        def _generate():
-            try:
-                # Use the new google.genai Client API
-                # Try different API patterns as the exact API may vary
-                try:
-                    # Pattern 1: client.models.generate_content
-                    response = self.client.models.generate_content(
-                        model=model,
-                        contents=full_prompt,
-                        **kwargs
+        try:
+            async with self.limited(prompt, system_prompt):
+                if self._agenerate_fn is not None:
+                    response = await self._agenerate_fn(model=model, **request)
+                else:
+                    # Synchronous SDK - run in the dedicated pool
+                    response = await asyncio.get_running_loop().run_in_executor(
+                        self._EXECUTOR,
+                        functools.partial(self._generate_fn, model=model, **request)
                     )
-                except (AttributeError, TypeError):
-                    # Pattern 2: Direct model access
-                    model_obj = self.client.get_model(model)
-                    response = model_obj.generate_content(full_prompt, **kwargs)
-                
-                # Extract text from response
-                return self._extract_text(response)
-            except Exception as e:
-                # Provide more context in error
-                raise ValueError(f"Gemini API call failed: {e}. Check API key and model name.")
+            return self._extract_text(response)
+        except Exception as e:
+            # Provide more context in error
+            raise ValueError(f"Gemini API call failed: {e}. Check API key and model name.")
+    
+    async def generate_stream(
+        self, prompt: str, model: str, system_prompt: Optional[str] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream response text chunk by chunk (falls back to a single chunk without client.aio)."""
+        if self._astream_fn is None:
+            yield await self.generate(prompt, model, system_prompt=system_prompt, **kwargs)
+            return
         
-        response_text = await loop.run_in_executor(None, _generate)
-        return response_text
+        try:
+            # The slot is held until the stream is drained
+            async with self.limited(prompt, system_prompt):
+                stream = await self._astream_fn(model=model, **self._request_kwargs(prompt, system_prompt, kwargs))
+                async for chunk in stream:
+                    text = getattr(chunk, "text", None)
+                    if text:
+                        yield text
+        except Exception as e:
+            raise ValueError(f"Gemini API call failed: {e}. Check API key and model name.")
     
     def _extract_text(self, response) -> str:
-        """Extract text from response object."""
-        # Handle different response formats
-        if hasattr(response, 'text') and response.text:
-            return response.text
+        """Extract text from response object.
         
-        if hasattr(response, 'candidates') and response.candidates:
-            candidate = response.candidates[0]
-            if hasattr(candidate, 'content'):
-                content = candidate.content
-                if hasattr(content, 'parts') and content.parts:
-                    part = content.parts[0]
-                    if hasattr(part, 'text'):
-                        return part.text
-                elif hasattr(content, 'text'):
-                    return content.text
+        The response shape is fixed for a given SDK version, so the extractor that
+        worked last time is tried first; the full scan only runs if it misses.
+        """
+        idx = self._extractor_idx
+        if idx is not None:
+            text = _try_extract(_EXTRACTORS[idx], response)
+            if text is not None:
+                return text
         
-        # Check for direct content attribute
-        if hasattr(response, 'content'):
-            content = response.content
-            if isinstance(content, str):
-                return content
-            elif hasattr(content, 'text'):
-                return content.text
+        for i, extractor in enumerate(_EXTRACTORS):
+            text = _try_extract(extractor, response)
+            if text is not None:
+                self._extractor_idx = i
+                return text
         
         # If we can't extract text, raise an error with response info
         import json
@@ -0,0 +1,32 @@
+"""Process-wide HTTP client shared by the HTTP-based providers."""
+from typing import Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401  (httpx only negotiates HTTP/2 when h2 is installed)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Sized for wide DAG fan-out: every provider's in-flight calls share these sockets
+_LIMITS = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The shared AsyncClient (created on first use, and again after close_http_client())."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(http2=_HTTP2, limits=_LIMITS, timeout=_TIMEOUT)
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client's connections (call on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
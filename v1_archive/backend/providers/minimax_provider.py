@@ -6,7 +6,7 @@ Uses Anthropic SDK with custom base URL as recommended by Minimax.
 """
 import os
 import anthropic
-import asyncio
+import httpx
 from typing import Optional
 from .base import AIProvider
 
@@ -20,9 +20,16 @@ class MinimaxProvider(AIProvider):
         self.group_id = group_id
         # Use Anthropic SDK with Minimax base URL as per official documentation
         # https://platform.minimax.io/docs/guides/text-generation
-        self.client = anthropic.Anthropic(
+        # Async client with its own long-lived connection pool: keep-alive sockets are reused
+        # across calls instead of each request blocking an executor thread
+        self.client = anthropic.AsyncAnthropic(
             api_key=api_key,
-            base_url="https://api.minimax.io/anthropic"
+            base_url="https://api.minimax.io/anthropic",
+            # Explicit, or the SDK adopts the http_client's timeout; keep its 600s default for long replies
+            timeout=anthropic.DEFAULT_TIMEOUT,
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=30),
+            ),
         )
     
     async def generate(self, prompt: str, model: str, system_prompt: Optional[str] = None, **kwargs) -> str:
@@ -62,13 +69,10 @@ class MinimaxProvider(AIProvider):
             group_id_preview = f"{self.group_id[:4]}...{self.group_id[-4:]}" if self.group_id and len(self.group_id) > 8 else (self.group_id or "None")
             group_id_info = f"Group ID: {group_id_preview} (set MINIMAX_DEBUG=true to see full)"
         
-        # Call API using Anthropic SDK (run in executor since it's synchronous)
-        loop = asyncio.get_event_loop()
+        # Call API using Anthropic SDK
         try:
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.messages.create(**params)
-            )
+            async with self.limited(prompt, system_prompt, params["max_tokens"]):
+                response = await self.client.messages.create(**params)
         except Exception as e:
             # Handle API errors
             error_msg = str(e)
@@ -96,6 +100,10 @@ class MinimaxProvider(AIProvider):
         
         return "\n".join(text_parts)
     
+    async def aclose(self):
+        """Close the client's pooled connections."""
+        await self.client.close()
+    
     def get_available_models(self) -> list[str]:
         """Get available Minimax models.
         
@@ -2,6 +2,7 @@
 import openai
 from typing import Optional
 from .base import AIProvider
+from .http_client import get_http_client
 
 
 class OpenAIProvider(AIProvider):
@@ -9,7 +10,8 @@ class OpenAIProvider(AIProvider):
     
     def __init__(self, api_key: str):
         super().__init__(api_key)
-        self.client = openai.AsyncOpenAI(api_key=api_key)
+        # The SDK adopts a passed-in client's timeout; keep its own (long) default for slow completions
+        self.client = openai.AsyncOpenAI(api_key=api_key, http_client=get_http_client(), timeout=openai.DEFAULT_TIMEOUT)
     
     async def generate(self, prompt: str, model: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """Generate response using OpenAI API."""
@@ -18,11 +20,12 @@ class OpenAIProvider(AIProvider):
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
-        response = await self.client.chat.completions.create(
-            model=model,
-            messages=messages,
-            **kwargs
-        )
+        async with self.limited(prompt, system_prompt, kwargs.get("max_tokens")):
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                **kwargs
+            )
         
         # Handle response
         if not response.choices or len(response.choices) == 0:
@@ -4,6 +4,7 @@ Uses the OpenAI-compatible API at https://openrouter.ai/api/v1.
 import openai
 from typing import Optional
 from .base import AIProvider
+from .http_client import get_http_client
 
 
 class OpenRouterProvider(AIProvider):
@@ -14,6 +15,8 @@ class OpenRouterProvider(AIProvider):
         self.client = openai.AsyncOpenAI(
             api_key=api_key,
             base_url="https://openrouter.ai/api/v1",
+            http_client=get_http_client(),
+            timeout=openai.DEFAULT_TIMEOUT,  # not the shared client's 60s read timeout
         )
 
     async def generate(self, prompt: str, model: str, system_prompt: Optional[str] = None, **kwargs) -> str:
@@ -23,11 +26,12 @@ class OpenRouterProvider(AIProvider):
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        response = await self.client.chat.completions.create(
-            model=model,
-            messages=messages,
-            **kwargs
-        )
+        async with self.limited(prompt, system_prompt, kwargs.get("max_tokens")):
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                **kwargs
+            )
 
         if not response.choices or len(response.choices) == 0:
             raise ValueError("OpenRouter API returned no choices in response")
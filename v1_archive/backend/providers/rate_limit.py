@@ -0,0 +1,31 @@
+"""Client-side pacing for provider API calls."""
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Allows `per_minute` units per minute, with bursts of up to a minute's worth.
+
+    acquire() waits until enough units have refilled. Callers are served one at a
+    time, in arrival order, so a large request can't be starved by small ones.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self._rate = self.capacity / 60.0  # units per second
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1):
+        # A request larger than the bucket waits for a full bucket instead of forever
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self._rate)
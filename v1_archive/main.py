@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 """Main entry point for the AI orchestration framework."""
 import asyncio
-from backend.cli import main
+from backend.cli import close_prompt_log, main, parse_args
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    try:
+        asyncio.run(main(use_plan_cache=args.cache))
+    finally:
+        close_prompt_log()